@@ -9,7 +9,7 @@ from functools import wraps
 import os
 from datetime import datetime
 from src.extractors.sheets_reader import SheetsReader
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from src.services.report_generator import ReportGenerator
 from src.analytics.ai_analyzer import extract_free_text_responses
 from src.utils.version import get_version_string, get_version_info
@@ -39,10 +39,10 @@ REPORT_CACHE: Dict[str, Any] = {
 }
 
 
-def load_sheet_data(verbose: bool = False) -> Dict[str, Any]:
+def load_sheet_data(verbose: bool = False, max_age_seconds: Optional[int] = None) -> Dict[str, Any]:
     """Load data from Google Sheets into memory."""
     global SHEET_DATA
-    SHEET_DATA = SheetsReader.fetch_all_tabs(verbose=verbose)
+    SHEET_DATA = SheetsReader.fetch_all_tabs(verbose=verbose, max_age_seconds=max_age_seconds)
     return SHEET_DATA
 
 
@@ -1015,7 +1015,8 @@ def summary_complete():
 def api_refresh():
     """Refresh data from Google Sheets and clear report cache."""
     try:
-        load_sheet_data(verbose=True)
+        # Always revalidate with Google on an explicit refresh
+        load_sheet_data(verbose=True, max_age_seconds=0)
         stats = get_stats()
 
         # Clear report cache when data is refreshed
@@ -6,12 +6,18 @@ Runs database initialization and data sync when the app starts on Railway.
 This ensures PostgreSQL is populated from Google Sheets on every deployment.
 """
 
+import hashlib
+import json
 import os
 import sys
 import logging
 import subprocess
+import threading
 import time
 import sqlite3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
 from init_database import create_database_tables, add_sample_data, verify_database
 
 # Configure logging for Railway
@@ -22,6 +28,73 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bump when create_database_tables changes so warm restarts re-run setup
+INIT_SCHEMA_VERSION = 1
+INIT_STAMP_FILE = '.railway_init_stamp'
+DATA_IMPORT_FILE = 'railway_data_import.sql'
+
+BULK_IMPORT_PRAGMAS = """
+    PRAGMA journal_mode=MEMORY;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-262144;
+"""
+POST_IMPORT_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA journal_mode=WAL;
+"""
+
+# Lines of child output kept for the failure summary (everything is logged live)
+OUTPUT_TAIL_LINES = 50
+
+
+def run_streaming(command, timeout: int = 300) -> subprocess.CompletedProcess:
+    """
+    Run a command, logging its combined stdout/stderr line by line as it runs.
+
+    Unlike subprocess.run(capture_output=True), output is never buffered in
+    full: memory stays O(line) and progress shows up in Railway's logs while
+    the child is still running. Only the last OUTPUT_TAIL_LINES lines are kept
+    and returned as stdout.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout
+    """
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        env={**os.environ, 'PYTHONUNBUFFERED': '1'}
+    )
+
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, kill_on_timeout)
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    timer.start()
+    try:
+        for line in process.stdout:
+            line = line.rstrip()
+            if line:
+                logger.info(f"   {line}")
+                tail.append(line)
+        returncode = process.wait()
+    finally:
+        timer.cancel()
+        process.stdout.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+
+    return subprocess.CompletedProcess(command, returncode, stdout='\n'.join(tail))
+
+
 def sync_data_from_google_sheets():
     """
     Extract data from Google Sheets and normalize to PostgreSQL.
@@ -41,74 +114,47 @@ def sync_data_from_google_sheets():
     logger.info("🐘 PostgreSQL detected - running automatic data sync")
 
     try:
-        # Step 1: Extract data from Google Sheets
+        # Step 1: Extract data from Google Sheets, normalizing each sheet as it lands
         logger.info("📥 Step 1/2: Extracting data from Google Sheets...")
         logger.info("   Source: 6 predefined JJF Technology Assessment spreadsheets")
+        logger.info("   Normalization is pipelined behind each spreadsheet download")
 
         start_time = time.time()
-        result = subprocess.run(
-            [sys.executable, 'src/extractors/improved_extractor.py'],
-            capture_output=True,
-            text=True,
+        result = run_streaming(
+            [sys.executable, 'src/extractors/improved_extractor.py', '--normalize'],
             timeout=300  # 5 minute timeout
         )
 
         if result.returncode != 0:
             logger.error(f"❌ Extraction failed with code {result.returncode}")
             if result.stdout:
-                logger.error("   === STDOUT ===")
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        logger.error(f"   {line}")
-            if result.stderr:
-                logger.error("   === STDERR ===")
-                for line in result.stderr.split('\n'):
-                    if line.strip():
-                        logger.error(f"   {line}")
+                # One log record for the whole tail instead of one per line
+                logger.error("   === OUTPUT (last lines) ===\n   " + result.stdout.replace('\n', '\n   '))
             # Continue anyway - app can start with empty or partial data
             return False
 
         extraction_time = time.time() - start_time
         logger.info(f"✅ Extraction completed in {extraction_time:.1f} seconds")
-        if result.stdout:
-            # Log last few lines of output
-            output_lines = result.stdout.strip().split('\n')
-            for line in output_lines[-5:]:
-                logger.info(f"   {line}")
 
-        # Step 2: Normalize data to PostgreSQL
+        # Step 2: Catch-up pass - only imports spreadsheets not already normalized in step 1
         logger.info("🔄 Step 2/2: Normalizing data to PostgreSQL...")
 
         start_time = time.time()
-        result = subprocess.run(
+        result = run_streaming(
             [sys.executable, 'src/normalizers/survey_normalizer.py', '--auto'],
-            capture_output=True,
-            text=True,
             timeout=300  # 5 minute timeout
         )
 
         if result.returncode != 0:
             logger.error(f"❌ Normalization failed with code {result.returncode}")
             if result.stdout:
-                logger.error("   === STDOUT ===")
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        logger.error(f"   {line}")
-            if result.stderr:
-                logger.error("   === STDERR ===")
-                for line in result.stderr.split('\n'):
-                    if line.strip():
-                        logger.error(f"   {line}")
+                # One log record for the whole tail instead of one per line
+                logger.error("   === OUTPUT (last lines) ===\n   " + result.stdout.replace('\n', '\n   '))
             # Continue anyway - app can start with raw data only
             return False
 
         normalization_time = time.time() - start_time
         logger.info(f"✅ Normalization completed in {normalization_time:.1f} seconds")
-        if result.stdout:
-            # Log last few lines of output
-            output_lines = result.stdout.strip().split('\n')
-            for line in output_lines[-5:]:
-                logger.info(f"   {line}")
 
         total_time = extraction_time + normalization_time
         logger.info("=" * 60)
@@ -129,6 +175,244 @@ def sync_data_from_google_sheets():
         return False
 
 
+def _is_ignorable_import_error(error: Exception) -> bool:
+    """Errors expected when replaying a dump over an initialized database."""
+    message = str(error)
+    return 'already exists' in message or 'UNIQUE constraint failed' in message
+
+
+def _execute_statements(conn, statements) -> int:
+    """Execute statements one at a time, tolerating already-applied ones."""
+    executed = 0
+    for statement in statements:
+        try:
+            conn.execute(statement)
+            executed += 1
+        except Exception as e:
+            if not _is_ignorable_import_error(e):
+                logger.warning(f"SQL import warning: {e}")
+    return executed
+
+
+# Dump lines that carry no data for the replay (transaction control is ours)
+SKIPPED_DUMP_LINE_PREFIXES = ('--', 'BEGIN', 'COMMIT', 'PRAGMA')
+
+
+def iter_sql_statements(lines):
+    """
+    Yield complete SQL statements from dump lines.
+
+    Comment, blank and transaction/PRAGMA lines are dropped as they are read,
+    and statements are assembled line by line instead of splitting the whole
+    file on ';' (which also broke on semicolons inside string literals).
+    """
+    buffer = []
+    for line in lines:
+        if not buffer:
+            stripped = line.strip()
+            if not stripped or stripped.startswith(SKIPPED_DUMP_LINE_PREFIXES):
+                continue
+        buffer.append(line)
+        if line.rstrip().endswith(';'):
+            statement = ''.join(buffer)
+            if sqlite3.complete_statement(statement):
+                buffer = []
+                yield statement.strip().rstrip(';')
+
+    if buffer:
+        statement = ''.join(buffer).strip()
+        if statement:
+            yield statement
+
+
+def import_sql_dump(conn, sql_path: str) -> int:
+    """
+    Replay a SQL dump file into an SQLite connection.
+
+    Consecutive INSERT statements are applied as one batch through
+    executescript inside a single transaction, so SQLite parses and runs them
+    in C without a Python round trip (and exception handler) per row. A batch
+    that fails is rolled back and replayed statement by statement so a single
+    bad row only costs a warning, matching the previous behaviour.
+
+    Returns:
+        Number of statements applied
+    """
+    imported = 0
+    batch = []
+
+    def flush_batch():
+        nonlocal imported
+        if not batch:
+            return
+        conn.commit()
+        try:
+            conn.executescript('BEGIN;\n' + ';\n'.join(batch) + ';\nCOMMIT;')
+            imported += len(batch)
+        except sqlite3.Error:
+            conn.rollback()
+            imported += _execute_statements(conn, batch)
+        batch.clear()
+
+    with open(sql_path, 'r') as f:
+        for statement in iter_sql_statements(f):
+            if statement.upper().startswith('INSERT'):
+                batch.append(statement)
+            else:
+                flush_batch()
+                imported += _execute_statements(conn, [statement])
+
+    flush_batch()
+    conn.commit()
+    return imported
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """blake2b digest of a file, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _current_init_state() -> Dict[str, Any]:
+    """Inputs that decide whether local database setup must run again."""
+    return {
+        'schema_version': INIT_SCHEMA_VERSION,
+        'import_digest': _file_digest(DATA_IMPORT_FILE),
+    }
+
+
+def is_init_stamp_current(*db_paths: str) -> bool:
+    """
+    Check whether a previous boot already initialized these databases.
+
+    True only if every database file still exists and the stamp was written
+    for the same schema version and the same railway_data_import.sql.
+    """
+    if not all(os.path.exists(path) for path in db_paths):
+        return False
+    try:
+        with open(INIT_STAMP_FILE, 'r') as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    current = _current_init_state()
+    return all(stamp.get(key) == value for key, value in current.items())
+
+
+def write_init_stamp():
+    """Record a successful local database setup for later boots."""
+    stamp = _current_init_state()
+    stamp['initialized_at'] = time.time()
+    try:
+        with open(INIT_STAMP_FILE, 'w') as f:
+            json.dump(stamp, f)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not write init stamp: {e}")
+
+
+def initialize_local_databases(main_exists: bool, survey_exists: bool) -> bool:
+    """Create, seed and verify the local SQLite databases."""
+    logger.info("🗄️ Creating database tables...")
+    if create_database_tables():
+        logger.info("✅ Database tables created")
+    else:
+        logger.error("❌ Failed to create database tables")
+        return False
+
+    # Add sample data if databases were empty
+    if not main_exists or not survey_exists:
+        logger.info("📊 Adding sample data...")
+        if add_sample_data():
+            logger.info("✅ Sample data added")
+        else:
+            logger.warning("⚠️ Failed to add sample data")
+
+    # Verify setup
+    logger.info("🔍 Verifying database setup...")
+    if verify_database():
+        logger.info("✅ Database verification passed")
+    else:
+        logger.error("❌ Database verification failed")
+        return False
+
+    return True
+
+
+def import_local_data() -> bool:
+    """
+    Import railway_data_import.sql into the main database if it only has sample data.
+
+    Returns:
+        False if the import failed, True if it succeeded or was not needed
+    """
+    try:
+        if os.path.exists(DATA_IMPORT_FILE):
+            logger.info("🔄 Checking if data import is needed...")
+
+            # Check current data count
+            with sqlite3.connect('surveyor_data_improved.db') as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT COUNT(*) FROM spreadsheets')
+                current_count = cursor.fetchone()[0]
+
+                if current_count <= 1:  # Only has sample data
+                    logger.info("📥 Auto-importing local data to Railway...")
+
+                    # The file is regenerated from the dump on failure, so trade
+                    # crash safety for bulk-load speed during the replay
+                    conn.executescript(BULK_IMPORT_PRAGMAS)
+
+                    # Import main database data
+                    imported_statements = import_sql_dump(conn, DATA_IMPORT_FILE)
+                    conn.executescript(POST_IMPORT_PRAGMAS)
+                    logger.info(f"✅ Imported {imported_statements} SQL statements")
+
+                    # Verify import (both counts in one query)
+                    cursor.execute(
+                        'SELECT (SELECT COUNT(*) FROM spreadsheets), (SELECT COUNT(*) FROM raw_data)'
+                    )
+                    new_spreadsheet_count, new_row_count = cursor.fetchone()
+
+                    logger.info(f"🎉 Data import completed: {new_spreadsheet_count} spreadsheets, {new_row_count} data rows")
+                else:
+                    logger.info(f"📊 Railway already has {current_count} spreadsheets - skipping data import")
+        else:
+            logger.info("📋 No data import file found - using initialized sample data")
+
+    except Exception as e:
+        logger.error(f"❌ Data import error: {e}")
+        return False
+
+    return True
+
+
+def prepare_local_databases(main_db: str, survey_db: str,
+                            main_exists: bool, survey_exists: bool) -> bool:
+    """Run local database setup unless a previous boot already did it."""
+    # Warm restart with persisted volumes: local setup already done
+    if is_init_stamp_current(main_db, survey_db):
+        logger.info("⚡ Databases already initialized for this schema and import file - skipping setup")
+        return True
+
+    if not initialize_local_databases(main_exists, survey_exists):
+        return False
+
+    # Auto-import local data if available and needed
+    if import_local_data():
+        write_init_stamp()
+    else:
+        # Continue anyway - the app should still work with sample data. No
+        # stamp, so the next boot retries the import.
+        logger.warning("⚠️ Data import incomplete - will retry on next boot")
+    return True
+
+
 def railway_database_init():
     """Initialize database for Railway deployment."""
 
@@ -155,81 +439,19 @@ def railway_database_init():
     
     # Initialize databases
     try:
-        logger.info("🗄️ Creating database tables...")
-        if create_database_tables():
-            logger.info("✅ Database tables created")
-        else:
-            logger.error("❌ Failed to create database tables")
-            return False
-        
-        # Add sample data if databases were empty
-        if not main_exists or not survey_exists:
-            logger.info("📊 Adding sample data...")
-            if add_sample_data():
-                logger.info("✅ Sample data added")
-            else:
-                logger.warning("⚠️ Failed to add sample data")
-        
-        # Verify setup
-        logger.info("🔍 Verifying database setup...")
-        if verify_database():
-            logger.info("✅ Database verification passed")
-        else:
-            logger.error("❌ Database verification failed")
-            return False
-        
-        # Auto-import local data if available and needed
-        try:
-            if os.path.exists('railway_data_import.sql'):
-                logger.info("🔄 Checking if data import is needed...")
-
-                # Check current data count
-                with sqlite3.connect('surveyor_data_improved.db') as conn:
-                    cursor = conn.cursor()
-                    cursor.execute('SELECT COUNT(*) FROM spreadsheets')
-                    current_count = cursor.fetchone()[0]
-
-                    if current_count <= 1:  # Only has sample data
-                        logger.info("📥 Auto-importing local data to Railway...")
-
-                        # Import main database data
-                        with open('railway_data_import.sql', 'r') as f:
-                            sql_content = f.read()
-                            statements = sql_content.split(';')
-                            imported_statements = 0
-
-                            for statement in statements:
-                                statement = statement.strip()
-                                if statement and not statement.startswith('--'):
-                                    try:
-                                        conn.execute(statement)
-                                        imported_statements += 1
-                                    except Exception as e:
-                                        if 'already exists' not in str(e) and 'UNIQUE constraint failed' not in str(e):
-                                            logger.warning(f"SQL import warning: {e}")
-
-                            conn.commit()
-                            logger.info(f"✅ Imported {imported_statements} SQL statements")
-
-                        # Verify import
-                        cursor.execute('SELECT COUNT(*) FROM spreadsheets')
-                        new_spreadsheet_count = cursor.fetchone()[0]
-                        cursor.execute('SELECT COUNT(*) FROM raw_data')
-                        new_row_count = cursor.fetchone()[0]
-
-                        logger.info(f"🎉 Data import completed: {new_spreadsheet_count} spreadsheets, {new_row_count} data rows")
-                    else:
-                        logger.info(f"📊 Railway already has {current_count} spreadsheets - skipping data import")
-            else:
-                logger.info("📋 No data import file found - using initialized sample data")
+        # Local SQLite setup and the Google Sheets -> PostgreSQL sync touch
+        # different databases, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            local_setup = executor.submit(
+                prepare_local_databases, main_db, survey_db, main_exists, survey_exists
+            )
+            # NEW: Automatic data sync from Google Sheets (PostgreSQL only)
+            sync = executor.submit(sync_data_from_google_sheets)
+
+            if not local_setup.result():
+                return False
+            sync_success = sync.result()
 
-        except Exception as e:
-            logger.error(f"❌ Data import error: {e}")
-            # Continue anyway - the app should still work with sample data
-
-        # NEW: Automatic data sync from Google Sheets (PostgreSQL only)
-        logger.info("")
-        sync_success = sync_data_from_google_sheets()
         if not sync_success:
             logger.warning("⚠️  Automatic data sync failed or was skipped")
             logger.warning("   App will continue with existing data")
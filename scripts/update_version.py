@@ -10,6 +10,12 @@ import re
 import subprocess
 import sys
 
+# Matches every build metadata assignment so version.py is rewritten in one pass
+VERSION_FIELDS_PATTERN = re.compile(
+    r'^(__version__|__build_date__|__git_commit__|__git_branch__)\s*=.*$',
+    re.MULTILINE
+)
+
 
 def get_git_info():
     """Get git commit and branch info."""
@@ -68,35 +74,22 @@ def update_version_file(new_version, version_file='version.py'):
     with open(version_file, 'r') as f:
         content = f.read()
 
-    # Update version
-    content = re.sub(
-        r'__version__\s*=\s*["\'][^"\']+["\']',
-        f'__version__ = "{new_version}"',
-        content
-    )
-
-    # Update build date
-    content = re.sub(
-        r'__build_date__\s*=\s*.*',
-        f'__build_date__ = "{build_date}"',
-        content
-    )
-
-    # Update git commit
-    if commit:
-        content = re.sub(
-            r'__git_commit__\s*=\s*.*',
-            f'__git_commit__ = "{commit}"',
-            content
-        )
-
-    # Update git branch
-    if branch:
-        content = re.sub(
-            r'__git_branch__\s*=\s*.*',
-            f'__git_branch__ = "{branch}"',
-            content
-        )
+    # Git fields are left untouched when git info is unavailable
+    values = {
+        '__version__': new_version,
+        '__build_date__': build_date,
+        '__git_commit__': commit,
+        '__git_branch__': branch,
+    }
+
+    def _replace(match):
+        value = values[match.group(1)]
+        if not value:
+            return match.group(0)
+        return f'{match.group(1)} = "{value}"'
+
+    # Update all metadata fields in a single pass
+    content = VERSION_FIELDS_PATTERN.sub(_replace, content)
 
     # Write updated content
     with open(version_file, 'w') as f:
@@ -15,9 +15,12 @@ def check_tables():
     tables = ['surveys', 'survey_responses', 'survey_questions', 'survey_answers']
 
     print("\n=== Table Counts ===")
-    for table in tables:
-        cur.execute(f"SELECT COUNT(*) FROM {table};")
-        count = cur.fetchone()[0]
+    # One round trip for all counts instead of one query per table
+    count_query = " UNION ALL ".join(
+        f"SELECT '{table}', COUNT(*) FROM {table}" for table in tables
+    )
+    cur.execute(count_query + ";")
+    for table, count in cur.fetchall():
         print(f"{table}: {count}")
 
     print("\n=== Sample Survey Data ===")
@@ -4,14 +4,30 @@
 import sqlite3
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 def main():
     conn = sqlite3.connect('simple_data.db')
+    # Read-side settings only: a bigger page cache, and the window query's
+    # sorts in memory (WAL/synchronous are write settings, and journal_mode
+    # would persistently change the file this script only views)
+    conn.executescript("PRAGMA cache_size=-65536; PRAGMA temp_store=MEMORY;")
     cursor = conn.cursor()
     
+    # Row count and first row (to show column structure) of every tab
     cursor.execute("""
-        SELECT tab_name, COUNT(*) as row_count
-        FROM tab_data
-        GROUP BY tab_name
+        SELECT tab_name, row_count, data_json
+        FROM (
+            SELECT tab_name, data_json,
+                   COUNT(*) OVER (PARTITION BY tab_name) as row_count,
+                   ROW_NUMBER() OVER (PARTITION BY tab_name ORDER BY id) as rn
+            FROM tab_data
+        )
+        WHERE rn = 1
         ORDER BY tab_name
     """)
     
@@ -19,19 +35,11 @@ def main():
     print("TAB EXTRACTION SUMMARY")
     print("="*80)
     
-    for tab_name, row_count in cursor.fetchall():
+    for tab_name, row_count, data_json in cursor.fetchall():
         print(f"\n[{tab_name}] - {row_count} rows")
         
-        # Get first row to show column structure
-        cursor.execute("""
-            SELECT data_json FROM tab_data
-            WHERE tab_name = ?
-            LIMIT 1
-        """, (tab_name,))
-        
-        row = cursor.fetchone()
-        if row:
-            data = json.loads(row[0])
+        if data_json:
+            data = orjson.loads(data_json) if ORJSON_AVAILABLE else json.loads(data_json)
             print(f"  Columns ({len(data)}):")
             for col in list(data.keys())[:5]:  # Show first 5 columns
                 print(f"    - {col}")
@@ -3,8 +3,10 @@ AI-Powered Survey Response Analyzer
 Uses OpenRouter with cost-effective models for qualitative analysis
 """
 
+import hashlib
 import json
 import os
+import sqlite3
 from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
@@ -17,6 +19,13 @@ load_dotenv(".env.local")
 class AIAnalyzer:
     """AI-powered analyzer for qualitative survey responses."""
 
+    # On-disk cache of consolidated texts, keyed by model, target length and
+    # input text, so re-rendered reports and repeated runs skip the LLM call.
+    # Set CONSOLIDATE_CACHE_PATH to an empty string to disable it.
+    CONSOLIDATE_CACHE_PATH = os.getenv(
+        "CONSOLIDATE_CACHE_PATH", os.path.join(".cache", "consolidate.db")
+    )
+
     def __init__(self):
         """Initialize OpenRouter client."""
         self.api_key = os.getenv("OPENROUTER_API_KEY")
@@ -196,6 +205,11 @@ Keep the summary professional, actionable, and suitable for a dashboard overview
         if len(text) <= max_chars:
             return text
 
+        cache_key = self._consolidate_cache_key(text, max_chars)
+        cached = self._read_consolidate_cache([cache_key])
+        if cache_key in cached:
+            return cached[cache_key]
+
         prompt = f"""Consolidate this text to approximately {max_chars} characters while preserving key insights:
 
 Original text ({len(text)} chars):
@@ -225,17 +239,9 @@ Return ONLY the consolidated text, no explanations or metadata:"""
             )
 
             consolidated = response.choices[0].message.content.strip()
-
-            # Remove quotes if LLM added them
-            if consolidated.startswith('"') and consolidated.endswith('"'):
-                consolidated = consolidated[1:-1]
-            if consolidated.startswith("'") and consolidated.endswith("'"):
-                consolidated = consolidated[1:-1]
-
-            # Fallback: if still too long, hard truncate
-            if len(consolidated) > max_chars + 20:
-                consolidated = consolidated[:max_chars] + "..."
-
+            consolidated = self._clean_consolidated(consolidated, max_chars)
+            if consolidated:
+                self._write_consolidate_cache({cache_key: consolidated})
             return consolidated
 
         except Exception as e:
@@ -243,6 +249,182 @@ Return ONLY the consolidated text, no explanations or metadata:"""
             # Fallback: simple truncation
             return text[:max_chars] + "..." if len(text) > max_chars else text
 
+    def consolidate_texts(self, items: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Consolidate several texts with a single LLM call.
+
+        Args:
+            items: Dict mapping a key to {"text": ..., "max_chars": ...}
+
+        Returns:
+            Dict mapping each key to its consolidated text (same as consolidate_text)
+        """
+        results = {}
+        pending = []
+        for key, item in items.items():
+            # Texts already short enough are returned as-is
+            if len(item["text"]) <= item["max_chars"]:
+                results[key] = item["text"]
+            else:
+                pending.append((key, item["text"], item["max_chars"]))
+
+        # Reuse texts consolidated by earlier calls
+        cache_keys = {
+            key: self._consolidate_cache_key(text, max_chars) for key, text, max_chars in pending
+        }
+        cached = self._read_consolidate_cache(list(cache_keys.values()))
+        for key, cache_key in cache_keys.items():
+            if cache_key in cached:
+                results[key] = cached[cache_key]
+        pending = [entry for entry in pending if entry[0] not in results]
+
+        if len(pending) == 1:
+            key, text, max_chars = pending[0]
+            results[key] = self.consolidate_text(text, max_chars=max_chars)
+        elif pending:
+            results.update(self._consolidate_batch(pending))
+
+        return {key: results[key] for key in items}
+
+    def _consolidate_batch(self, pending: List[tuple]) -> Dict[str, str]:
+        """Consolidate (key, text, max_chars) tuples in one request."""
+        texts = "\n\n".join(
+            [
+                f"[{i}] Target: {max_chars} characters (currently {len(text)}):\n{text}"
+                for i, (_, text, max_chars) in enumerate(pending, 1)
+            ]
+        )
+
+        prompt = f"""Consolidate each of the following texts to approximately its target length while preserving key insights:
+
+{texts}
+
+Requirements:
+- Keep essential information and insights
+- Remove redundant phrases and filler words
+- Use concise, professional language
+- Maintain the same tone and meaning
+- Each target length is a strict maximum
+
+Return ONLY this JSON, with one entry per text:
+{{
+  "results": [
+    {{"id": 1, "text": "Consolidated text"}}
+  ]
+}}"""
+
+        consolidated = {}
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert editor who consolidates verbose text into concise summaries while preserving key insights. Return only the requested JSON."
+                    },
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=100 * len(pending) + 50
+            )
+
+            content = response.choices[0].message.content
+
+            # Extract JSON from markdown code blocks if present
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0].strip()
+            elif "```" in content:
+                content = content.split("```")[1].split("```")[0].strip()
+
+            for entry in json.loads(content)["results"]:
+                consolidated[int(entry["id"])] = str(entry["text"]).strip()
+
+        except Exception as e:
+            print(f"Error consolidating texts: {e}")
+
+        results = {}
+        fresh = {}
+        for i, (key, text, max_chars) in enumerate(pending, 1):
+            if consolidated.get(i):
+                results[key] = self._clean_consolidated(consolidated[i], max_chars)
+                fresh[self._consolidate_cache_key(text, max_chars)] = results[key]
+            else:
+                # Fallback: simple truncation
+                results[key] = text[:max_chars] + "..."
+        self._write_consolidate_cache(fresh)
+        return results
+
+    def _consolidate_cache_key(self, text: str, max_chars: int) -> str:
+        """Hash of everything that determines a consolidated text."""
+        return hashlib.sha256(f"{self.model}|{max_chars}|{text}".encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _open_consolidate_cache(cls) -> Optional[sqlite3.Connection]:
+        """Open the consolidation cache database, or None if it is disabled."""
+        if not cls.CONSOLIDATE_CACHE_PATH:
+            return None
+        os.makedirs(os.path.dirname(cls.CONSOLIDATE_CACHE_PATH) or ".", exist_ok=True)
+        conn = sqlite3.connect(cls.CONSOLIDATE_CACHE_PATH, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS consolidated (hash TEXT PRIMARY KEY, text TEXT NOT NULL)"
+        )
+        return conn
+
+    def _read_consolidate_cache(self, cache_keys: List[str]) -> Dict[str, str]:
+        """Look up cached consolidations. Failures are non-fatal."""
+        if not cache_keys:
+            return {}
+        try:
+            conn = self._open_consolidate_cache()
+            if conn is None:
+                return {}
+            try:
+                placeholders = ",".join("?" * len(cache_keys))
+                rows = conn.execute(
+                    f"SELECT hash, text FROM consolidated WHERE hash IN ({placeholders})",
+                    cache_keys,
+                ).fetchall()
+            finally:
+                conn.close()
+            return dict(rows)
+        except (sqlite3.Error, OSError):
+            return {}
+
+    def _write_consolidate_cache(self, entries: Dict[str, str]) -> None:
+        """Store consolidations returned by the LLM. Failures are non-fatal."""
+        if not entries:
+            return
+        try:
+            conn = self._open_consolidate_cache()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO consolidated (hash, text) VALUES (?, ?)",
+                        entries.items(),
+                    )
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError):
+            pass
+
+    @staticmethod
+    def _clean_consolidated(consolidated: str, max_chars: int) -> str:
+        """Strip quotes the LLM added and hard truncate if still too long."""
+        # Remove quotes if LLM added them
+        if consolidated.startswith('"') and consolidated.endswith('"'):
+            consolidated = consolidated[1:-1]
+        if consolidated.startswith("'") and consolidated.endswith("'"):
+            consolidated = consolidated[1:-1]
+
+        # Fallback: if still too long, hard truncate
+        if len(consolidated) > max_chars + 20:
+            consolidated = consolidated[:max_chars] + "..."
+
+        return consolidated
+
     def analyze_organization_qualitative(
         self, org_name: str, all_responses: Dict[str, List[Dict[str, Any]]]
     ) -> Dict[str, Any]:
@@ -8,11 +8,146 @@ Provides statistical analysis and reporting capabilities for the normalized surv
 import os
 import sqlite3
 import json
+import copy
+import functools
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Iterator
 from collections import defaultdict
 import statistics
 
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+
+# Seconds an aggregate query result is served from memory before re-querying
+CACHE_TTL_SECONDS = int(os.getenv('ANALYTICS_CACHE_TTL', '60'))
+# Results with rolling "recent" windows drift faster, so expire them sooner
+RECENT_CACHE_TTL_SECONDS = min(30, CACHE_TTL_SECONDS)
+
+# Indexes for the analytics filters, join keys and GROUP BYs below (the
+# normalizer's schema already indexes the plain foreign keys)
+ANALYTICS_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS idx_sa_question_empty ON survey_answers(question_id, is_empty)',
+    'CREATE INDEX IF NOT EXISTS idx_sa_response_empty ON survey_answers(response_id, is_empty, question_id)',
+    'CREATE INDEX IF NOT EXISTS idx_sr_survey_created ON survey_responses(survey_id, created_at)',
+    'CREATE INDEX IF NOT EXISTS idx_sr_created ON survey_responses(created_at)',
+    'CREATE INDEX IF NOT EXISTS idx_respondents_browser ON respondents(browser)',
+    'CREATE INDEX IF NOT EXISTS idx_respondents_device ON respondents(device)',
+)
+# SQLite only: answers in (question, is_empty, text) order, so
+# get_answer_distribution groups straight off the index with no table lookups
+# or temp B-tree (PostgreSQL btree entries cap out on long answer texts)
+SQLITE_ANALYTICS_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS idx_sa_question_answer ON survey_answers(question_id, is_empty, answer_text)',
+)
+
+# Per-connection SQLite settings for the pooled read connections
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA temp_store=MEMORY',
+)
+
+# Idle SQLite connections kept open for reuse
+SQLITE_POOL_SIZE = int(os.getenv('ANALYTICS_POOL_SIZE', '4'))
+
+# Dashboard queries run side by side (WAL readers do not block each other)
+DASHBOARD_WORKERS = 4
+
+# Per-survey aggregates behind get_survey_breakdown/get_survey_completion_stats,
+# recomputed by SurveyAnalytics.refresh_materialized_views() after imports
+MV_SURVEY_STATS_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS mv_survey_stats (
+        survey_id INTEGER PRIMARY KEY,
+        response_count INTEGER NOT NULL,
+        unique_respondents INTEGER NOT NULL,
+        question_count INTEGER NOT NULL,
+        completion_rate REAL,
+        first_response TIMESTAMP,
+        last_response TIMESTAMP,
+        total_possible_answers INTEGER NOT NULL,
+        actual_answers INTEGER NOT NULL,
+        completion_percentage REAL,
+        avg_question_completion REAL,
+        refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+# Trigram full-text index over answer_text (SQLite only). The trigram
+# tokenizer serves LIKE '%term%' from the index for terms of 3+ characters,
+# so search results match the plain LIKE scan. Triggers keep it in sync.
+SEARCH_FTS_SCHEMA = (
+    '''CREATE VIRTUAL TABLE IF NOT EXISTS survey_answers_fts USING fts5(
+        answer_text, content='survey_answers', content_rowid='id', tokenize='trigram'
+    )''',
+    '''CREATE TRIGGER IF NOT EXISTS survey_answers_fts_ai AFTER INSERT ON survey_answers BEGIN
+        INSERT INTO survey_answers_fts(rowid, answer_text) VALUES (new.id, new.answer_text);
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS survey_answers_fts_ad AFTER DELETE ON survey_answers BEGIN
+        INSERT INTO survey_answers_fts(survey_answers_fts, rowid, answer_text)
+        VALUES ('delete', old.id, old.answer_text);
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS survey_answers_fts_au AFTER UPDATE OF answer_text ON survey_answers BEGIN
+        INSERT INTO survey_answers_fts(survey_answers_fts, rowid, answer_text)
+        VALUES ('delete', old.id, old.answer_text);
+        INSERT INTO survey_answers_fts(rowid, answer_text) VALUES (new.id, new.answer_text);
+    END''',
+)
+# Shorter search terms have no trigram to look up and use the plain scan
+MIN_FTS_TERM_LENGTH = 3
+
+# Per-answer columns and joins shared by export_survey_data and
+# iter_survey_responses
+EXPORT_RESPONSE_COLUMNS = (
+    'sr.id as response_id',
+    'sr.created_at as response_date',
+    'r.browser',
+    'r.device',
+    'r.respondent_hash',
+    'sq.question_key',
+    'sq.question_text',
+    'sa.answer_text',
+    'sa.answer_numeric',
+    'sa.answer_boolean',
+    'sa.is_empty',
+)
+EXPORT_RESPONSE_JOINS = '''survey_responses sr
+                JOIN respondents r ON sr.respondent_id = r.id
+                JOIN survey_answers sa ON sr.id = sa.response_id
+                JOIN survey_questions sq ON sa.question_id = sq.id'''
+
+
+def cached_query(ttl_seconds: Optional[int] = None) -> Callable:
+    """
+    Cache a SurveyAnalytics method's result per (method, args) for a TTL.
+
+    Hits return a deep copy so callers can't mutate the cached value.
+    Call SurveyAnalytics.invalidate() after new survey data is written.
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            ttl = CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            entry = self._cache.get(key)
+            if entry is None or entry[0] <= now:
+                entry = (now + ttl, method(self, *args, **kwargs))
+                self._cache[key] = entry
+            return copy.deepcopy(entry[1])
+        return wrapper
+    return decorator
+
 
 class SurveyAnalytics:
     """Analytics engine for survey data."""
@@ -34,8 +169,284 @@ class SurveyAnalytics:
         self.use_postgresql = use_postgresql
         self.database_url = database_url or os.getenv('DATABASE_URL')
 
-    def get_connection(self):
-        """Get database connection with row factory."""
+        # (method name, args) -> (expires_at, result); see cached_query
+        self._cache: Dict[tuple, tuple] = {}
+        self._indexes_ready = False
+        self._views_ready = False
+        self._fts_ready = False
+        self._pool: queue.Queue = queue.Queue(maxsize=SQLITE_POOL_SIZE)
+
+    def invalidate(self):
+        """Drop all cached query results (call after new survey data lands)."""
+        self._cache.clear()
+
+    @contextmanager
+    def get_connection(self) -> Iterator[Any]:
+        """
+        Borrow a database connection with row factory.
+
+        SQLite connections come from a pool and are returned after use, so
+        the file, WAL and page cache stay open across queries. PostgreSQL
+        connections are opened per use and closed afterwards. The block
+        commits on success and rolls back on error, as before.
+        """
+        conn = self._acquire()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._release(conn)
+
+    def ensure_materialized_views(self, conn):
+        """
+        Create mv_survey_stats (once per instance) and refresh it when stale.
+
+        The staleness check runs on every call, since the normalizer can
+        re-import data under a long-running instance: the table is stale
+        when it is missing surveys or a sheet was synced after its last
+        refresh (sync_tracking.last_sync_timestamp > refreshed_at).
+        """
+        cursor = conn.cursor()
+        if not self._views_ready:
+            cursor.execute(MV_SURVEY_STATS_SCHEMA)
+            conn.commit()
+            self._views_ready = True
+        cursor.execute('''
+            SELECT
+                (SELECT COUNT(*) FROM mv_survey_stats) as stats_rows,
+                (SELECT COUNT(*) FROM surveys) as survey_rows,
+                EXISTS (
+                    SELECT 1 FROM sync_tracking
+                    WHERE last_sync_timestamp > (SELECT MIN(refreshed_at) FROM mv_survey_stats)
+                ) as synced_since_refresh
+        ''')
+        state = cursor.fetchone()
+        if state['stats_rows'] != state['survey_rows'] or state['synced_since_refresh']:
+            self._refresh_materialized_views(cursor)
+            conn.commit()
+            self.invalidate()
+
+    def refresh_materialized_views(self):
+        """
+        Recompute mv_survey_stats from the normalized tables.
+
+        Call after new survey data is imported; the breakdown and
+        completion dashboards read this table instead of aggregating.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(MV_SURVEY_STATS_SCHEMA)
+            self._refresh_materialized_views(cursor)
+        self._views_ready = True
+        self.invalidate()
+
+    def _refresh_materialized_views(self, cursor):
+        """
+        Replace mv_survey_stats' rows in the caller's transaction.
+
+        refreshed_at is stamped with the same local-time clock the normalizer
+        uses for sync_tracking, so ensure_materialized_views can compare them.
+        """
+        param_placeholder = '%s' if self.use_postgresql else '?'
+        # Each table is aggregated per survey and joined 1:1 (no responses x
+        # questions x answers cross product), grouping on primary keys only. completion_rate counts a
+        # response without answers as one unanswered row;
+        # avg_question_completion is the answered share of all
+        # (response, question) pairs.
+        cursor.execute('DELETE FROM mv_survey_stats')
+        cursor.execute(f'''
+            INSERT INTO mv_survey_stats (
+                survey_id, response_count, unique_respondents, question_count,
+                completion_rate, first_response, last_response,
+                total_possible_answers, actual_answers,
+                completion_percentage, avg_question_completion, refreshed_at
+            )
+            WITH response_answers AS (
+                SELECT
+                    sr.survey_id,
+                    COUNT(sa.id) as answer_count,
+                    COUNT(CASE WHEN sa.is_empty = false THEN 1 END) as answered_count
+                FROM survey_responses sr
+                LEFT JOIN survey_answers sa ON sr.id = sa.response_id
+                GROUP BY sr.id
+            ),
+            answer_stats AS (
+                SELECT
+                    survey_id,
+                    SUM(answered_count) * 1.0 /
+                        SUM(CASE WHEN answer_count = 0 THEN 1 ELSE answer_count END) as completion_rate
+                FROM response_answers
+                GROUP BY survey_id
+            ),
+            matched_answers AS (
+                SELECT
+                    sr.survey_id,
+                    COUNT(*) as total_answers,
+                    COUNT(CASE WHEN sa.is_empty = false THEN 1 END) as actual_answers
+                FROM survey_answers sa
+                JOIN survey_responses sr ON sa.response_id = sr.id
+                JOIN survey_questions sq ON sa.question_id = sq.id AND sq.survey_id = sr.survey_id
+                GROUP BY sr.survey_id
+            ),
+            response_stats AS (
+                SELECT
+                    survey_id,
+                    COUNT(*) as response_count,
+                    COUNT(DISTINCT respondent_id) as unique_respondents,
+                    MIN(created_at) as first_response,
+                    MAX(created_at) as last_response
+                FROM survey_responses
+                GROUP BY survey_id
+            ),
+            question_stats AS (
+                SELECT survey_id, COUNT(*) as question_count
+                FROM survey_questions
+                GROUP BY survey_id
+            )
+            SELECT
+                s.id,
+                COALESCE(rs.response_count, 0),
+                COALESCE(rs.unique_respondents, 0),
+                COALESCE(qs.question_count, 0),
+                COALESCE(ans.completion_rate, 0.0),
+                rs.first_response,
+                rs.last_response,
+                COALESCE(ma.total_answers, 0),
+                COALESCE(ma.actual_answers, 0),
+                ROUND(ma.actual_answers * 100.0 / NULLIF(ma.total_answers, 0), 1),
+                COALESCE(ma.actual_answers, 0) * 1.0 / (
+                    COALESCE(rs.response_count, 1) * COALESCE(qs.question_count, 1)
+                ),
+                {param_placeholder}
+            FROM surveys s
+            LEFT JOIN response_stats rs ON s.id = rs.survey_id
+            LEFT JOIN question_stats qs ON s.id = qs.survey_id
+            LEFT JOIN answer_stats ans ON s.id = ans.survey_id
+            LEFT JOIN matched_answers ma ON s.id = ma.survey_id
+        ''', (datetime.now().isoformat(sep=' '),))
+
+    def _created_since(self, column: str, days: int) -> tuple:
+        """
+        Return (predicate SQL, params) selecting rows whose column falls in the
+        last `days` days. days is bound, not formatted, so the statement text
+        is the same for every window.
+        """
+        days = int(days)
+        if self.use_postgresql:
+            return f"{column} >= NOW() - %s * INTERVAL '1 day'", (days,)
+        return f"{column} >= datetime('now', ?)", (f'-{days} days',)
+
+    def _acquire(self):
+        """Take an idle pooled SQLite connection, or open a new one."""
+        if not self.use_postgresql:
+            try:
+                return self._pool.get_nowait()
+            except queue.Empty:
+                pass
+
+        conn = self._connect()
+        if not self.use_postgresql:
+            for pragma in SQLITE_PRAGMAS:
+                conn.execute(pragma)
+        if not self._indexes_ready:
+            self.ensure_indexes(conn)
+        return conn
+
+    def _release(self, conn):
+        """Return a SQLite connection to the pool (closing it if the pool is full)."""
+        if self.use_postgresql:
+            conn.close()
+            return
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def ensure_indexes(self, conn):
+        """Create the analytics indexes and refresh planner statistics (once per instance)."""
+        try:
+            cursor = conn.cursor()
+            for index_sql in ANALYTICS_INDEXES:
+                cursor.execute(index_sql)
+            if not self.use_postgresql:
+                for index_sql in SQLITE_ANALYTICS_INDEXES:
+                    cursor.execute(index_sql)
+                self._ensure_search_index(cursor)
+            cursor.execute('ANALYZE')
+            conn.commit()
+            self._indexes_ready = True
+        except Exception as e:
+            # Schema not created yet or read-only database: queries still work
+            conn.rollback()
+            print(f"⚠️  Could not create analytics indexes: {e}")
+
+    def _ensure_search_index(self, cursor):
+        """Create the answer_text FTS index and its triggers, rebuilding it when they were missing."""
+        cursor.execute('''
+            SELECT COUNT(*) as count FROM sqlite_master
+            WHERE type = 'trigger' AND name LIKE 'survey_answers_fts_%'
+        ''')
+        # Triggers vanish when the normalizer recreates survey_answers
+        needs_rebuild = cursor.fetchone()['count'] < 3
+        try:
+            for statement in SEARCH_FTS_SCHEMA:
+                cursor.execute(statement)
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5/trigram: search keeps the LIKE scan
+            print(f"⚠️  Full-text search index unavailable: {e}")
+            self._fts_ready = False
+            return
+        if needs_rebuild:
+            cursor.execute("INSERT INTO survey_answers_fts(survey_answers_fts) VALUES ('rebuild')")
+        self._fts_ready = True
+
+    def _search_index_usable(self, conn) -> bool:
+        """
+        Whether the FTS index can serve a search right now.
+
+        Checked on every search: a re-normalization recreates survey_answers
+        (dropping the triggers and the index) while this instance stays
+        alive, so the index is rebuilt here when its triggers are gone.
+        """
+        if not self._fts_ready:
+            return False
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT COUNT(*) as count FROM sqlite_master
+            WHERE type = 'trigger' AND name LIKE 'survey_answers_fts_%'
+        ''')
+        if cursor.fetchone()['count'] < 3:
+            self._ensure_search_index(cursor)
+            conn.commit()
+        return self._fts_ready
+
+    def _fetch_records(self, conn, sql: str, params=()) -> List[Dict[str, Any]]:
+        """
+        Run a query and return its rows as dictionaries.
+
+        On SQLite with pandas installed the rows are read column-wise by
+        read_sql_query; NULLs come back as None and numbers as Python
+        scalars, so the records match the cursor path.
+        """
+        if PANDAS_AVAILABLE and not self.use_postgresql:
+            frame = pd.read_sql_query(sql, conn, params=params)
+            frame = frame.astype(object).where(frame.notna(), None)
+            return frame.to_dict('records')
+
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def _connect(self):
+        """Open a new database connection with row factory."""
         if self.use_postgresql:
             import psycopg2
             import psycopg2.extras
@@ -43,183 +454,158 @@ class SurveyAnalytics:
             conn.cursor_factory = psycopg2.extras.RealDictCursor
             return conn
         else:
-            conn = sqlite3.connect(self.db_path)
+            # Pooled connections may be used from another thread than the
+            # one that opened them, but never by two threads at once
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
             conn.row_factory = sqlite3.Row
             return conn
     
+    @cached_query(RECENT_CACHE_TTL_SECONDS)
     def get_survey_overview(self) -> Dict[str, Any]:
         """Get high-level survey statistics."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
-            # Basic counts
-            cursor.execute('SELECT COUNT(*) as count FROM surveys')
-            total_surveys = cursor.fetchone()['count']
-
-            cursor.execute('SELECT COUNT(*) as count FROM survey_responses')
-            total_responses = cursor.fetchone()['count']
-
-            cursor.execute('SELECT COUNT(DISTINCT respondent_id) as count FROM survey_responses')
-            unique_respondents = cursor.fetchone()['count']
-
-            cursor.execute('SELECT COUNT(*) as count FROM survey_questions')
-            total_questions = cursor.fetchone()['count']
+            # Recent activity - database-agnostic date filtering (an
+            # idx_sr_created range search on both backends)
+            recent_clause, recent_params = self._created_since('created_at', 7)
 
-            cursor.execute('SELECT COUNT(*) as count FROM survey_answers WHERE is_empty = false')
-            answered_questions = cursor.fetchone()['count']
+            # All counts in one round-trip
+            cursor.execute(f'''
+                SELECT
+                    (SELECT COUNT(*) FROM surveys) as total_surveys,
+                    (SELECT COUNT(*) FROM survey_responses) as total_responses,
+                    (SELECT COUNT(DISTINCT respondent_id) FROM survey_responses) as unique_respondents,
+                    (SELECT COUNT(*) FROM survey_questions) as total_questions,
+                    (SELECT COUNT(*) FROM survey_answers WHERE is_empty = false) as answered_questions,
+                    (SELECT COUNT(*) FROM survey_responses
+                     WHERE {recent_clause}) as recent_responses
+            ''', recent_params)
+            counts = cursor.fetchone()
+
+            total_responses = counts['total_responses']
+            total_questions = counts['total_questions']
+            answered_questions = counts['answered_questions']
 
             # Response rate calculation
             total_possible_answers = total_responses * total_questions if total_questions > 0 else 0
             response_rate = (answered_questions / total_possible_answers * 100) if total_possible_answers > 0 else 0
 
-            # Recent activity - database-agnostic date handling
-            if self.use_postgresql:
-                cursor.execute('''
-                    SELECT COUNT(*) as count
-                    FROM survey_responses
-                    WHERE created_at >= NOW() - INTERVAL '7 days'
-                ''')
-            else:
-                cursor.execute('''
-                    SELECT COUNT(*) as count
-                    FROM survey_responses
-                    WHERE created_at >= datetime('now', '-7 days')
-                ''')
-            recent_responses = cursor.fetchone()['count']
-
             return {
-                'total_surveys': total_surveys,
+                'total_surveys': counts['total_surveys'],
                 'total_responses': total_responses,
-                'unique_respondents': unique_respondents,
+                'unique_respondents': counts['unique_respondents'],
                 'total_questions': total_questions,
                 'answered_questions': answered_questions,
                 'response_rate': round(response_rate, 1),
-                'recent_responses': recent_responses
+                'recent_responses': counts['recent_responses']
             }
     
+    @cached_query()
     def get_survey_breakdown(self) -> List[Dict[str, Any]]:
         """Get breakdown by survey type."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            
+            self.ensure_materialized_views(conn)
+
             cursor.execute('''
                 SELECT
                     s.id,
                     s.survey_name,
                     s.survey_type,
-                    COUNT(DISTINCT sr.id) as response_count,
-                    COUNT(DISTINCT sr.respondent_id) as unique_respondents,
-                    COUNT(DISTINCT sq.id) as question_count,
-                    AVG(CASE WHEN sa.is_empty = false THEN 1.0 ELSE 0.0 END) as completion_rate,
-                    MIN(sr.created_at) as first_response,
-                    MAX(sr.created_at) as last_response
+                    mv.response_count,
+                    mv.unique_respondents,
+                    mv.question_count,
+                    mv.completion_rate,
+                    mv.first_response,
+                    mv.last_response
                 FROM surveys s
-                LEFT JOIN survey_responses sr ON s.id = sr.survey_id
-                LEFT JOIN survey_questions sq ON s.id = sq.survey_id
-                LEFT JOIN survey_answers sa ON sr.id = sa.response_id
-                GROUP BY s.id, s.survey_name, s.survey_type
-                ORDER BY response_count DESC
+                JOIN mv_survey_stats mv ON s.id = mv.survey_id
+                ORDER BY mv.response_count DESC
             ''')
             
             return [dict(row) for row in cursor.fetchall()]
     
+    @cached_query()
     def get_response_activity(self, days: int = 30) -> List[Dict[str, Any]]:
         """Get response activity over time."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Database-agnostic date filtering
-            if self.use_postgresql:
-                query = f'''
-                    SELECT
-                        DATE(sr.created_at) as response_date,
-                        COUNT(*) as response_count,
-                        COUNT(DISTINCT sr.respondent_id) as unique_respondents,
-                        s.survey_type,
-                        s.survey_name
-                    FROM survey_responses sr
-                    JOIN surveys s ON sr.survey_id = s.id
-                    WHERE sr.created_at >= NOW() - INTERVAL '{days} days'
-                    GROUP BY DATE(sr.created_at), s.survey_type, s.survey_name
-                    ORDER BY response_date DESC
-                '''
-            else:
-                query = f'''
-                    SELECT
-                        DATE(sr.created_at) as response_date,
-                        COUNT(*) as response_count,
-                        COUNT(DISTINCT sr.respondent_id) as unique_respondents,
-                        s.survey_type,
-                        s.survey_name
-                    FROM survey_responses sr
-                    JOIN surveys s ON sr.survey_id = s.id
-                    WHERE sr.created_at >= datetime('now', '-{days} days')
-                    GROUP BY DATE(sr.created_at), s.survey_type, s.survey_name
-                    ORDER BY response_date DESC
-                '''
-
-            cursor.execute(query)
-            return [dict(row) for row in cursor.fetchall()]
+        # Served from the time series query, which groups the same window by
+        # date, survey type and survey name
+        return self.get_time_series_data(days)['response_activity']
     
+    @cached_query()
     def get_respondent_analysis(self) -> Dict[str, Any]:
         """Analyze respondent patterns."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Browser breakdown
-            cursor.execute('''
-                SELECT 
-                    browser,
-                    COUNT(*) as count,
-                    COUNT(DISTINCT respondent_hash) as unique_users
-                FROM respondents
-                WHERE browser IS NOT NULL AND browser != ''
-                GROUP BY browser
-                ORDER BY count DESC
-            ''')
-            browser_stats = [dict(row) for row in cursor.fetchall()]
-            
-            # Device breakdown
+            # Browser, device and response-frequency breakdowns in one
+            # round-trip; the facet column says which list a row belongs to
             cursor.execute('''
-                SELECT 
-                    device,
-                    COUNT(*) as count,
-                    COUNT(DISTINCT respondent_hash) as unique_users
-                FROM respondents
-                WHERE device IS NOT NULL AND device != ''
-                GROUP BY device
-                ORDER BY count DESC
-            ''')
-            device_stats = [dict(row) for row in cursor.fetchall()]
-            
-            # Response frequency
-            cursor.execute('''
-                SELECT 
-                    total_responses,
-                    COUNT(*) as respondent_count
-                FROM respondents
-                GROUP BY total_responses
-                ORDER BY total_responses
+                SELECT facet, label, total_responses, row_count, unique_users
+                FROM (
+                    SELECT
+                        'browser' as facet,
+                        browser as label,
+                        NULL as total_responses,
+                        COUNT(*) as row_count,
+                        COUNT(DISTINCT respondent_hash) as unique_users
+                    FROM respondents
+                    WHERE browser IS NOT NULL AND browser != ''
+                    GROUP BY browser
+                    UNION ALL
+                    SELECT 'device', device, NULL, COUNT(*), COUNT(DISTINCT respondent_hash)
+                    FROM respondents
+                    WHERE device IS NOT NULL AND device != ''
+                    GROUP BY device
+                    UNION ALL
+                    SELECT 'frequency', NULL, total_responses, COUNT(*), NULL
+                    FROM respondents
+                    GROUP BY total_responses
+                ) facets
+                ORDER BY
+                    facet,
+                    CASE WHEN facet = 'frequency' THEN total_responses ELSE -row_count END
             ''')
-            frequency_stats = [dict(row) for row in cursor.fetchall()]
-            
+
+            browser_stats = []
+            device_stats = []
+            frequency_stats = []
+            for row in cursor.fetchall():
+                if row['facet'] == 'browser':
+                    browser_stats.append({
+                        'browser': row['label'],
+                        'count': row['row_count'],
+                        'unique_users': row['unique_users']
+                    })
+                elif row['facet'] == 'device':
+                    device_stats.append({
+                        'device': row['label'],
+                        'count': row['row_count'],
+                        'unique_users': row['unique_users']
+                    })
+                else:
+                    frequency_stats.append({
+                        'total_responses': row['total_responses'],
+                        'respondent_count': row['row_count']
+                    })
+
             return {
                 'browser_breakdown': browser_stats,
                 'device_breakdown': device_stats,
                 'response_frequency': frequency_stats
             }
     
+    @cached_query()
     def get_question_analytics(self, survey_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get analytics for survey questions."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
             # Use different parameter placeholder for PostgreSQL vs SQLite
             param_placeholder = '%s' if self.use_postgresql else '?'
             where_clause = f"WHERE sq.survey_id = {param_placeholder}" if survey_id else ""
             params = [survey_id] if survey_id else []
-            
-            cursor.execute(f'''
+
+            return self._fetch_records(conn, f'''
                 SELECT
                     sq.id,
                     sq.question_key,
@@ -228,7 +614,7 @@ class SurveyAnalytics:
                     COUNT(sa.id) as total_answers,
                     COUNT(CASE WHEN sa.is_empty = false THEN 1 END) as answered_count,
                     COUNT(CASE WHEN sa.is_empty = true THEN 1 END) as empty_count,
-                    ROUND(AVG(CASE WHEN sa.is_empty = false THEN 1.0 ELSE 0.0 END) * 100, 1) as response_rate,
+                    ROUND(COUNT(CASE WHEN sa.is_empty = false THEN 1 END) * 100.0 / COUNT(*), 1) as response_rate,
                     COUNT(DISTINCT sa.answer_text) as unique_answers,
                     AVG(sa.answer_numeric) as avg_numeric_value,
                     COUNT(CASE WHEN sa.answer_boolean = true THEN 1 END) as true_count,
@@ -237,11 +623,9 @@ class SurveyAnalytics:
                 JOIN surveys s ON sq.survey_id = s.id
                 LEFT JOIN survey_answers sa ON sq.id = sa.question_id
                 {where_clause}
-                GROUP BY sq.id, sq.question_key, sq.question_text, s.survey_name
+                GROUP BY sq.id, s.id
                 ORDER BY response_rate DESC, answered_count DESC
             ''', params)
-            
-            return [dict(row) for row in cursor.fetchall()]
     
     def get_answer_distribution(self, question_id: int, limit: int = 10) -> List[Dict[str, Any]]:
         """Get answer distribution for a specific question."""
@@ -255,126 +639,143 @@ class SurveyAnalytics:
                 SELECT
                     answer_text,
                     COUNT(*) as count,
-                    ROUND(COUNT(*) * 100.0 / (
-                        SELECT COUNT(*)
-                        FROM survey_answers
-                        WHERE question_id = {param_placeholder} AND is_empty = false
-                    ), 1) as percentage
+                    ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 1) as percentage
                 FROM survey_answers
                 WHERE question_id = {param_placeholder} AND is_empty = false
                 GROUP BY answer_text
                 ORDER BY count DESC
                 LIMIT {param_placeholder}
-            ''', (question_id, question_id, limit))
+            ''', (question_id, limit))
             
             return [dict(row) for row in cursor.fetchall()]
     
+    @cached_query()
     def get_survey_completion_stats(self) -> List[Dict[str, Any]]:
         """Get completion statistics by survey."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            self.ensure_materialized_views(conn)
+
+            return self._fetch_records(conn, '''
                 SELECT
                     s.id,
                     s.survey_name,
                     s.survey_type,
-                    COUNT(DISTINCT sr.id) as total_responses,
-                    COUNT(DISTINCT sq.id) as total_questions,
-                    COUNT(sa.id) as total_possible_answers,
-                    COUNT(CASE WHEN sa.is_empty = false THEN 1 END) as actual_answers,
-                    ROUND(
-                        COUNT(CASE WHEN sa.is_empty = false THEN 1 END) * 100.0 /
-                        NULLIF(COUNT(sa.id), 0), 1
-                    ) as completion_percentage,
-                    AVG(
-                        CASE WHEN sa.is_empty = false THEN 1.0 ELSE 0.0 END
-                    ) as avg_question_completion
+                    mv.response_count as total_responses,
+                    mv.question_count as total_questions,
+                    mv.total_possible_answers,
+                    mv.actual_answers,
+                    mv.completion_percentage,
+                    mv.avg_question_completion
                 FROM surveys s
-                LEFT JOIN survey_responses sr ON s.id = sr.survey_id
-                LEFT JOIN survey_questions sq ON s.id = sq.survey_id
-                LEFT JOIN survey_answers sa ON sr.id = sa.response_id AND sq.id = sa.question_id
-                GROUP BY s.id, s.survey_name, s.survey_type
-                ORDER BY completion_percentage DESC
+                JOIN mv_survey_stats mv ON s.id = mv.survey_id
+                ORDER BY mv.completion_percentage DESC
             ''')
-            
-            return [dict(row) for row in cursor.fetchall()]
     
+    @cached_query()
     def get_time_series_data(self, days: int = 30) -> Dict[str, Any]:
         """Get time series data for charts."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
             # Database-agnostic date filtering for daily response counts
-            if self.use_postgresql:
-                daily_query = f'''
-                    SELECT
-                        DATE(created_at) as date,
-                        COUNT(*) as responses,
-                        COUNT(DISTINCT respondent_id) as unique_respondents
-                    FROM survey_responses
-                    WHERE created_at >= NOW() - INTERVAL '{days} days'
-                    GROUP BY DATE(created_at)
-                    ORDER BY date
-                '''
-            else:
-                daily_query = f'''
-                    SELECT
-                        DATE(created_at) as date,
-                        COUNT(*) as responses,
-                        COUNT(DISTINCT respondent_id) as unique_respondents
-                    FROM survey_responses
-                    WHERE created_at >= datetime('now', '-{days} days')
-                    GROUP BY DATE(created_at)
-                    ORDER BY date
-                '''
-
-            cursor.execute(daily_query)
-            daily_data = [dict(row) for row in cursor.fetchall()]
-
-            # Database-agnostic date filtering for survey type breakdown
-            if self.use_postgresql:
-                breakdown_query = f'''
-                    SELECT
-                        DATE(sr.created_at) as date,
-                        s.survey_type,
-                        COUNT(*) as responses
-                    FROM survey_responses sr
-                    JOIN surveys s ON sr.survey_id = s.id
-                    WHERE sr.created_at >= NOW() - INTERVAL '{days} days'
-                    GROUP BY DATE(sr.created_at), s.survey_type
-                    ORDER BY date, s.survey_type
-                '''
-            else:
-                breakdown_query = f'''
-                    SELECT
-                        DATE(sr.created_at) as date,
-                        s.survey_type,
-                        COUNT(*) as responses
-                    FROM survey_responses sr
-                    JOIN surveys s ON sr.survey_id = s.id
-                    WHERE sr.created_at >= datetime('now', '-{days} days')
-                    GROUP BY DATE(sr.created_at), s.survey_type
-                    ORDER BY date, s.survey_type
-                '''
-
-            cursor.execute(breakdown_query)
-            type_breakdown = [dict(row) for row in cursor.fetchall()]
+            since_clause, since_params = self._created_since('created_at', days)
+            daily_data = self._fetch_records(conn, f'''
+                SELECT
+                    DATE(created_at) as date,
+                    COUNT(*) as responses,
+                    COUNT(DISTINCT respondent_id) as unique_respondents
+                FROM survey_responses
+                WHERE {since_clause}
+                GROUP BY DATE(created_at)
+                ORDER BY date
+            ''', since_params)
+
+            # Database-agnostic date filtering for per-survey activity, which
+            # also feeds the survey type breakdown below
+            since_clause, since_params = self._created_since('sr.created_at', days)
+            activity = self._fetch_records(conn, f'''
+                SELECT
+                    DATE(sr.created_at) as response_date,
+                    COUNT(*) as response_count,
+                    COUNT(DISTINCT sr.respondent_id) as unique_respondents,
+                    s.survey_type,
+                    s.survey_name
+                FROM survey_responses sr
+                JOIN surveys s ON sr.survey_id = s.id
+                WHERE {since_clause}
+                GROUP BY DATE(sr.created_at), s.survey_type, s.survey_name
+                ORDER BY response_date DESC
+            ''', since_params)
+
+            type_counts = defaultdict(int)
+            for row in activity:
+                type_counts[(row['response_date'], row['survey_type'])] += row['response_count']
+            # Ordered by date, then survey type with NULL first as in SQLite
+            type_breakdown = [
+                {'date': date, 'survey_type': survey_type, 'responses': responses}
+                for (date, survey_type), responses in sorted(
+                    type_counts.items(),
+                    key=lambda item: (item[0][0], item[0][1] is not None, item[0][1] or '')
+                )
+            ]
 
             return {
                 'daily_responses': daily_data,
-                'type_breakdown': type_breakdown
+                'type_breakdown': type_breakdown,
+                'response_activity': activity
             }
     
+    def get_dashboard_bundle(self, days: int = 30) -> Dict[str, Any]:
+        """
+        Get the overview, survey breakdown, respondent analysis and time series
+        together.
+
+        The four queries are independent, so they run concurrently, each on
+        its own pooled connection; wall-clock time is the slowest one rather
+        than the sum.
+        """
+        # Set up indexes and mv_survey_stats once before the workers start,
+        # so they don't race to create them
+        with self.get_connection() as conn:
+            self.ensure_materialized_views(conn)
+
+        with ThreadPoolExecutor(max_workers=DASHBOARD_WORKERS) as executor:
+            overview = executor.submit(self.get_survey_overview)
+            survey_breakdown = executor.submit(self.get_survey_breakdown)
+            respondent_analysis = executor.submit(self.get_respondent_analysis)
+            time_series = executor.submit(self.get_time_series_data, days)
+
+            return {
+                'overview': overview.result(),
+                'survey_breakdown': survey_breakdown.result(),
+                'respondent_analysis': respondent_analysis.result(),
+                'time_series': time_series.result()
+            }
+
     def search_responses(self, search_term: str, survey_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search through survey responses."""
+        return list(self.iter_search_responses(search_term, survey_id))
+
+    def iter_search_responses(self, search_term: str,
+                              survey_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield search_responses rows one at a time.
+
+        The pooled connection is held until the iterator is exhausted or
+        closed, so consume it promptly (e.g. while streaming a response).
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
             # Use different parameter placeholder for PostgreSQL vs SQLite
             param_placeholder = '%s' if self.use_postgresql else '?'
 
-            where_clauses = [f"sa.answer_text LIKE {param_placeholder}"]
+            if len(search_term) >= MIN_FTS_TERM_LENGTH and self._search_index_usable(conn):
+                # Trigram index finds the matching answer ids; only those are joined
+                where_clauses = [f'''sa.id IN (
+                    SELECT rowid FROM survey_answers_fts
+                    WHERE answer_text LIKE {param_placeholder}
+                )''']
+            else:
+                where_clauses = [f"sa.answer_text LIKE {param_placeholder}"]
             params = [f"%{search_term}%"]
 
             if survey_id:
@@ -402,7 +803,8 @@ class SurveyAnalytics:
                 LIMIT 100
             ''', params)
 
-            return [dict(row) for row in cursor.fetchall()]
+            for row in cursor:
+                yield dict(row)
     
     def export_survey_data(self, survey_id: int) -> Dict[str, Any]:
         """Export complete survey data for analysis."""
@@ -412,36 +814,58 @@ class SurveyAnalytics:
             # Use different parameter placeholder for PostgreSQL vs SQLite
             param_placeholder = '%s' if self.use_postgresql else '?'
 
-            # Get survey info
-            cursor.execute(f'SELECT * FROM surveys WHERE id = {param_placeholder}', (survey_id,))
-            survey_info = dict(cursor.fetchone())
-
-            # Get all responses with answers
+            # Survey info and all responses with answers in one query: the
+            # survey's columns lead every row (a lone row if it has no answers)
             cursor.execute(f'''
-                SELECT
-                    sr.id as response_id,
-                    sr.created_at as response_date,
-                    r.browser,
-                    r.device,
-                    r.respondent_hash,
-                    sq.question_key,
-                    sq.question_text,
-                    sa.answer_text,
-                    sa.answer_numeric,
-                    sa.answer_boolean,
-                    sa.is_empty
-                FROM survey_responses sr
-                JOIN respondents r ON sr.respondent_id = r.id
-                JOIN survey_answers sa ON sr.id = sa.response_id
-                JOIN survey_questions sq ON sa.question_id = sq.id
-                WHERE sr.survey_id = {param_placeholder}
+                WITH s_info AS (
+                    SELECT * FROM surveys WHERE id = {param_placeholder}
+                )
+                SELECT s_info.*, {', '.join(EXPORT_RESPONSE_COLUMNS)}
+                FROM s_info
+                LEFT JOIN ({EXPORT_RESPONSE_JOINS}) ON sr.survey_id = s_info.id
                 ORDER BY sr.created_at, sq.question_order
             ''', (survey_id,))
 
-            responses = [dict(row) for row in cursor.fetchall()]
+            survey_columns = [column[0] for column in cursor.description[:-len(EXPORT_RESPONSE_COLUMNS)]]
+            response_columns = [column[0] for column in cursor.description[-len(EXPORT_RESPONSE_COLUMNS):]]
+
+            rows = cursor.fetchall()
+            if not rows:
+                raise ValueError(f"Survey {survey_id} not found")
+
+            survey_info = {column: rows[0][column] for column in survey_columns}
+            responses = [
+                {column: row[column] for column in response_columns}
+                for row in rows
+                if row['response_id'] is not None
+            ]
 
             return {
                 'survey_info': survey_info,
                 'responses': responses,
                 'export_date': datetime.now().isoformat()
             }
+
+    def iter_survey_responses(self, survey_id: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a survey's answer rows (the export_survey_data 'responses') one at a time.
+
+        The pooled connection is held until the iterator is exhausted or
+        closed, so consume it promptly (e.g. while streaming a response).
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            # Use different parameter placeholder for PostgreSQL vs SQLite
+            param_placeholder = '%s' if self.use_postgresql else '?'
+
+            # Get all responses with answers
+            cursor.execute(f'''
+                SELECT {', '.join(EXPORT_RESPONSE_COLUMNS)}
+                FROM {EXPORT_RESPONSE_JOINS}
+                WHERE sr.survey_id = {param_placeholder}
+                ORDER BY sr.created_at, sq.question_order
+            ''', (survey_id,))
+
+            for row in cursor:
+                yield dict(row)
@@ -9,20 +9,162 @@ Supports both SQLite (local) and PostgreSQL (production) via DATABASE_URL.
 """
 
 import sqlite3
+import codecs
 import csv
-import urllib.request
-import urllib.parse
+import hashlib
+import io
+import itertools
 import re
 import json
 import os
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 import time
+import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import httpx
 from db_utils import DatabaseConnection, adapt_sql_for_postgresql, get_placeholder, is_postgresql
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# SQLite tuning for the bulk write path. WAL + synchronous=NORMAL avoids an
+# fsync per commit while keeping the file consistent; the rest are
+# per-connection cache/mmap settings. Exclusive locking is deliberately not
+# used so the normalizer can read while extraction is still writing.
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+)
+
+# Spreadsheets are downloaded concurrently; DB writes stay on the calling thread
+MAX_DOWNLOAD_WORKERS = 6
+
+# Secondary indexes on raw_data. They are dropped while a run bulk-loads
+# rows and rebuilt once afterwards instead of being maintained per INSERT.
+RAW_DATA_INDEXES = (
+    ('idx_raw_data_spreadsheet', 'spreadsheet_id'),
+    ('idx_raw_data_hash', 'data_hash'),
+)
+
+# Hot-path statements, formatted once per extractor with the backend's
+# placeholder so every call hands the driver the identical SQL string
+SQL_DELETE_RAW = 'DELETE FROM raw_data WHERE spreadsheet_id = {ph}'
+SQL_INSERT_RAW = (
+    'INSERT INTO raw_data (spreadsheet_id, row_number, data_json, data_hash) '
+    'VALUES ({ph}, {ph}, {ph}, {ph})'
+)
+
+# Columns update_extraction_job may set
+EXTRACTION_JOB_UPDATE_COLUMNS = (
+    'status',
+    'completed_at',
+    'processed_spreadsheets',
+    'successful_spreadsheets',
+    'total_rows',
+    'processed_rows',
+    'error_message',
+)
+
+# Per-sheet job progress is kept in memory and written at most this often
+PROGRESS_FLUSH_INTERVAL_SECONDS = 10
+
+# URL and page-title patterns, compiled once rather than on every call
+SHEET_URL_RE = re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)(?:.*?[#&?]gid=([0-9]+))?')
+TITLE_PATTERNS = (
+    re.compile(r'<title>([^<]+)</title>', re.IGNORECASE),
+    re.compile(r'"title":"([^"]+)"', re.IGNORECASE),
+    re.compile(r'data-title="([^"]+)"', re.IGNORECASE),
+)
+
+
+def now_timestamp() -> str:
+    """
+    Current local time as the text sqlite3's (deprecated) datetime adapter
+    stored, so values stay comparable with the normalizer's sync stamps.
+    """
+    return datetime.now().isoformat(sep=' ')
+
+
+def dumps_row(row: Dict[str, Any]) -> str:
+    """
+    Serialize a raw_data row compactly with sorted keys (orjson when available).
+
+    Both paths emit raw UTF-8 (ensure_ascii=False matches orjson), so
+    data_json and its data_hash do not depend on whether orjson is installed.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(row, option=orjson.OPT_SORT_KEYS).decode('utf-8')
+    return json.dumps(row, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def parse_csv_arrow(csv_bytes: bytes) -> Optional[List[Dict[str, str]]]:
+    """
+    Parse a CSV payload with pyarrow's multithreaded C reader.
+
+    Every column is read as a string and rows are keyed by the header
+    exactly like csv.DictReader. Returns None when Arrow rejects the
+    payload (e.g. ragged rows) so the caller can fall back to csv.
+    """
+    header = next(csv.reader(io.TextIOWrapper(io.BytesIO(csv_bytes), encoding='utf-8', newline='')), None)
+    if not header:
+        return []
+
+    # Positional names avoid Arrow's rules for blank/duplicate headers; the
+    # header line itself is read as the first data row and dropped
+    names = [f'f{i}' for i in range(len(header))]
+    try:
+        table = pacsv.read_csv(
+            io.BytesIO(csv_bytes),
+            read_options=pacsv.ReadOptions(column_names=names, use_threads=True),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types=dict.fromkeys(names, pa.string()),
+                strings_can_be_null=False
+            )
+        )
+    except pa.ArrowInvalid:
+        return None
+
+    columns = [column.to_pylist() for column in table.slice(1).columns]
+    return [dict(zip(header, values)) for values in zip(*columns)]
+
+
+def iter_csv_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Decode a stream of UTF-8 byte chunks into newline-terminated text lines.
+
+    Line endings are kept so csv can reassemble quoted multi-line fields;
+    only one partial line is ever buffered.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    pending = ''
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split('\n')
+        for line in lines:
+            yield line + '\n'
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
 
 class ImprovedExtractor:
     """Improved data extractor for Google Sheets."""
@@ -30,8 +172,21 @@ class ImprovedExtractor:
     def __init__(self, db_path: str = "surveyor_data_improved.db"):
         self.db_path = db_path
         self.db_connection = DatabaseConnection(db_path)
+        self._conn = None
+        self._http_client = None
+        self._http_client_lock = threading.Lock()
+        self._parsed_urls: Dict[str, tuple] = {}
+        self._dirty_progress: Dict[str, Any] = {}
+        self._last_progress_flush = 0.0
         self.use_postgresql = is_postgresql()
         self.placeholder = get_placeholder()
+        self._delete_raw_sql = SQL_DELETE_RAW.format(ph=self.placeholder)
+        self._insert_raw_sql = SQL_INSERT_RAW.format(ph=self.placeholder)
+        self._update_job_sql = 'UPDATE extraction_jobs SET {} WHERE id = {}'.format(
+            ', '.join(f"{column} = COALESCE({self.placeholder}, {column})"
+                      for column in EXTRACTION_JOB_UPDATE_COLUMNS),
+            self.placeholder
+        )
 
         if self.use_postgresql:
             logger.info("Extractor using PostgreSQL database")
@@ -47,13 +202,20 @@ class ImprovedExtractor:
             "https://docs.google.com/spreadsheets/d/1f3NKqhNR-CJr_e6_eLSTLbSFuYY8Gm0dxpSL0mlybMA/edit?usp=sharing"
         ]
     
+    def parse_sheet_url(self, url: str) -> tuple:
+        """Parse a Google Sheets URL into (spreadsheet_id, gid) in one pass; gid defaults to '0'."""
+        parsed = self._parsed_urls.get(url)
+        if parsed is None:
+            match = SHEET_URL_RE.search(url)
+            if not match:
+                raise ValueError(f"Invalid Google Sheets URL: {url}")
+            parsed = (match.group(1), match.group(2) or '0')
+            self._parsed_urls[url] = parsed
+        return parsed
+
     def extract_spreadsheet_id(self, url: str) -> str:
         """Extract spreadsheet ID from Google Sheets URL."""
-        pattern = r'/spreadsheets/d/([a-zA-Z0-9-_]+)'
-        match = re.search(pattern, url)
-        if not match:
-            raise ValueError(f"Invalid Google Sheets URL: {url}")
-        return match.group(1)
+        return self.parse_sheet_url(url)[0]
     
     def get_csv_export_url(self, spreadsheet_id: str, gid: str = "0") -> str:
         """Get CSV export URL for a Google Sheet."""
@@ -63,18 +225,25 @@ class ImprovedExtractor:
         """Get public CSV URL that works for shared sheets."""
         return f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/export?format=csv"
     
-    def download_sheet_data(self, url: str) -> tuple[List[Dict[str, Any]], str]:
-        """Download data from a Google Sheet, return data and title."""
+    def download_sheet_data(self, url: str) -> tuple[List[tuple], str]:
+        """
+        Download data from a Google Sheet, return encoded raw_data rows and title.
+
+        Rows are JSON-encoded and hashed as they are parsed (see
+        encode_raw_rows), so each CSV row dict is dropped as soon as it is
+        read and the result can go straight to insert_raw_rows.
+        """
         try:
-            spreadsheet_id = self.extract_spreadsheet_id(url)
+            spreadsheet_id, gid = self.parse_sheet_url(url)
             
-            # Try multiple CSV export methods
-            csv_urls = [
+            # Try multiple CSV export methods, starting with the tab the URL points at
+            csv_urls = list(dict.fromkeys([
                 self.get_public_csv_url(spreadsheet_id),
+                self.get_csv_export_url(spreadsheet_id, gid),
                 self.get_csv_export_url(spreadsheet_id, "0"),
                 self.get_csv_export_url(spreadsheet_id, "1"),
                 self.get_csv_export_url(spreadsheet_id, "2")
-            ]
+            ]))
             
             print(f"📥 Downloading data from spreadsheet {spreadsheet_id}")
             
@@ -82,29 +251,32 @@ class ImprovedExtractor:
                 try:
                     print(f"  Trying method {i+1}: {csv_url}")
                     
-                    # Create request with headers
-                    req = urllib.request.Request(csv_url)
-                    req.add_header('User-Agent', 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-                    
-                    with urllib.request.urlopen(req, timeout=30) as response:
-                        csv_data = response.read().decode('utf-8')
+                    # Parse rows straight off the response stream instead of
+                    # buffering the body, decoding it and copying it again
+                    with self.get_http_client().stream('GET', csv_url) as response:
+                        response.raise_for_status()
+                        if PYARROW_AVAILABLE:
+                            # Arrow's C reader needs the whole body
+                            response.read()
+                        lines = iter_csv_lines(response.iter_bytes())
+                        first_line = next(lines, '')
+                        
+                        # Check if we got actual CSV data rather than an HTML page
+                        if first_line.strip() and not first_line.startswith('<!DOCTYPE') and not first_line.startswith('<html'):
+                            rows = parse_csv_arrow(response.content) if PYARROW_AVAILABLE else None
+                            if rows is None:
+                                # Use CSV reader to handle quoted fields properly
+                                rows = csv.DictReader(itertools.chain([first_line], lines))
+                            data = list(self.encode_raw_rows(spreadsheet_id, rows))
+                        else:
+                            data = []
                     
-                    # Check if we got actual CSV data
-                    if csv_data.strip() and not csv_data.startswith('<!DOCTYPE') and not csv_data.startswith('<html'):
-                        # Parse CSV
-                        lines = csv_data.strip().split('\n')
-                        if lines:
-                            # Use CSV reader to handle quoted fields properly
-                            import io
-                            csv_reader = csv.DictReader(io.StringIO(csv_data))
-                            data = list(csv_reader)
-                            
-                            if data:
-                                print(f"✅ Downloaded {len(data)} rows from spreadsheet {spreadsheet_id}")
-                                
-                                # Try to extract title from the first method that worked
-                                title = self.extract_title_from_url(url, spreadsheet_id)
-                                return data, title
+                    if data:
+                        print(f"✅ Downloaded {len(data)} rows from spreadsheet {spreadsheet_id}")
+                        
+                        # Try to extract title from the first method that worked
+                        title = self.extract_title_from_url(url, spreadsheet_id)
+                        return data, title
                     
                 except Exception as e:
                     print(f"    Method {i+1} failed: {e}")
@@ -121,21 +293,12 @@ class ImprovedExtractor:
         """Try to extract the title from the spreadsheet."""
         try:
             # Try to get the title from the edit page
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-            
-            with urllib.request.urlopen(req, timeout=10) as response:
-                html_content = response.read().decode('utf-8', errors='ignore')
+            response = self.get_http_client().get(url, timeout=10)
+            html_content = response.content.decode('utf-8', errors='ignore')
             
             # Look for title in the HTML
-            title_patterns = [
-                r'<title>([^<]+)</title>',
-                r'"title":"([^"]+)"',
-                r'data-title="([^"]+)"'
-            ]
-            
-            for pattern in title_patterns:
-                match = re.search(pattern, html_content, re.IGNORECASE)
+            for pattern in TITLE_PATTERNS:
+                match = pattern.search(html_content)
                 if match:
                     title = match.group(1).strip()
                     # Clean up the title
@@ -148,9 +311,52 @@ class ImprovedExtractor:
         
         return f"Spreadsheet_{spreadsheet_id}"
     
+    def get_connection(self):
+        """
+        Get the extractor's shared database connection, opening it on first use.
+
+        One connection serves the whole run so connect/PRAGMA setup is paid
+        once instead of per helper call. Call close() when done.
+        """
+        if self._conn is None:
+            conn = self.db_connection.get_connection()
+            if not self.use_postgresql:
+                for pragma in SQLITE_PRAGMAS:
+                    conn.execute(pragma)
+            self._conn = conn
+        return self._conn
+
+    def get_http_client(self) -> httpx.Client:
+        """
+        Get the keep-alive HTTP client shared by all downloads.
+
+        Download workers call this concurrently, so creation is locked to make
+        sure only one client is ever built (and later closed).
+        """
+        if self._http_client is None:
+            with self._http_client_lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        headers={'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'},
+                        timeout=30,
+                        follow_redirects=True,
+                        limits=httpx.Limits(max_connections=MAX_DOWNLOAD_WORKERS * 2,
+                                            max_keepalive_connections=MAX_DOWNLOAD_WORKERS * 2)
+                    )
+        return self._http_client
+
+    def close(self):
+        """Close the shared database connection and HTTP client."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
     def create_database(self):
         """Create database with improved schema (PostgreSQL or SQLite)."""
-        conn = self.db_connection.get_connection()
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         # Spreadsheets table
@@ -199,22 +405,40 @@ class ImprovedExtractor:
         ''')
         cursor.execute(schema_sql)
 
-        # Create indexes
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_raw_data_spreadsheet ON raw_data(spreadsheet_id)')
+        # Create indexes (raw_data indexes are built after loading, see
+        # create_raw_data_indexes)
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_spreadsheets_id ON spreadsheets(spreadsheet_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_raw_data_hash ON raw_data(data_hash)')
 
         conn.commit()
-        conn.close()
 
         db_type = "PostgreSQL" if self.use_postgresql else f"SQLite ({self.db_path})"
         print(f"✅ Database created: {db_type}")
     
+    def drop_raw_data_indexes(self):
+        """Drop raw_data's secondary indexes ahead of a bulk load."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        for index_name, _ in RAW_DATA_INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+        conn.commit()
+
+    def create_raw_data_indexes(self):
+        """(Re)build raw_data's secondary indexes once the rows are loaded."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        for index_name, column in RAW_DATA_INDEXES:
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON raw_data({column})')
+        conn.commit()
+    
     def save_spreadsheet_info(self, spreadsheet_id: str, url: str, title: str, sheet_type: str = None):
         """Save spreadsheet information to database."""
-        conn = self.db_connection.get_connection()
-        cursor = conn.cursor()
+        conn = self.get_connection()
+        self._upsert_spreadsheet(conn.cursor(), spreadsheet_id, url, title, sheet_type)
+        conn.commit()
 
+    def _upsert_spreadsheet(self, cursor, spreadsheet_id: str, url: str, title: str,
+                            sheet_type: str = None):
+        """Insert or update a spreadsheets row, stamping last_synced, without committing."""
         # PostgreSQL uses ON CONFLICT, SQLite uses INSERT OR REPLACE
         if self.use_postgresql:
             cursor.execute('''
@@ -222,55 +446,70 @@ class ImprovedExtractor:
                 VALUES (%s, %s, %s, %s, %s)
                 ON CONFLICT (spreadsheet_id) DO UPDATE
                 SET url = EXCLUDED.url, title = EXCLUDED.title, sheet_type = EXCLUDED.sheet_type, last_synced = EXCLUDED.last_synced
-            ''', (spreadsheet_id, url, title, sheet_type, datetime.now()))
+            ''', (spreadsheet_id, url, title, sheet_type, now_timestamp()))
         else:
             cursor.execute('''
                 INSERT OR REPLACE INTO spreadsheets (spreadsheet_id, url, title, sheet_type, last_synced)
                 VALUES (?, ?, ?, ?, ?)
-            ''', (spreadsheet_id, url, title, sheet_type, datetime.now()))
-
-        conn.commit()
-        conn.close()
+            ''', (spreadsheet_id, url, title, sheet_type, now_timestamp()))
     
+    def encode_raw_rows(self, spreadsheet_id: str,
+                        rows: Iterable[Dict[str, Any]]) -> Iterator[tuple]:
+        """Yield raw_data insert tuples (spreadsheet_id, row_number, data_json, data_hash)."""
+        for i, row in enumerate(rows, 1):
+            # Create hash for deduplication
+            data_str = dumps_row(row)
+            data_hash = hashlib.sha256(data_str.encode()).hexdigest()
+            yield (spreadsheet_id, i, data_str, data_hash)
+
+    def insert_raw_rows(self, spreadsheet_id: str, encoded_rows: Iterable[tuple],
+                        spreadsheet_info: Optional[tuple] = None) -> int:
+        """
+        Replace a spreadsheet's raw_data with already-encoded rows; return the row count.
+
+        The DELETE and the inserts form one transaction: one commit on
+        success, and on failure the previous rows are left untouched. When
+        spreadsheet_info (url, title, sheet_type) is given, the spreadsheets
+        row is upserted in the same transaction, so its new last_synced only
+        becomes visible (e.g. to a concurrent normalizer) together with the
+        rows it describes.
+        """
+        conn = self.get_connection()
+        row_count = 0
+
+        def counted():
+            nonlocal row_count
+            for row in encoded_rows:
+                row_count += 1
+                yield row
+
+        # Commits on success, rolls back on exception
+        with conn:
+            cursor = conn.cursor()
+
+            # Take the write lock up front instead of upgrading mid-transaction
+            if not self.use_postgresql and not conn.in_transaction:
+                cursor.execute('BEGIN IMMEDIATE')
+            if spreadsheet_info:
+                self._upsert_spreadsheet(cursor, spreadsheet_id, *spreadsheet_info)
+            cursor.execute(self._delete_raw_sql, (spreadsheet_id,))
+
+            # One prepared statement for every row instead of a parse per row
+            cursor.executemany(self._insert_raw_sql, counted())
+
+        print(f"💾 Saved {row_count} rows for spreadsheet {spreadsheet_id}")
+        return row_count
+
     def save_raw_data(self, spreadsheet_id: str, data: List[Dict[str, Any]]):
         """Save raw data to database with deduplication."""
         if not data:
             return
 
-        conn = self.db_connection.get_connection()
-        cursor = conn.cursor()
-
-        # Clear existing data for this spreadsheet
-        if self.use_postgresql:
-            cursor.execute('DELETE FROM raw_data WHERE spreadsheet_id = %s', (spreadsheet_id,))
-        else:
-            cursor.execute('DELETE FROM raw_data WHERE spreadsheet_id = ?', (spreadsheet_id,))
-
-        # Insert new data with hashing for deduplication
-        import hashlib
-        for i, row in enumerate(data, 1):
-            # Create hash for deduplication
-            data_str = json.dumps(row, sort_keys=True)
-            data_hash = hashlib.sha256(data_str.encode()).hexdigest()
-
-            if self.use_postgresql:
-                cursor.execute('''
-                    INSERT INTO raw_data (spreadsheet_id, row_number, data_json, data_hash)
-                    VALUES (%s, %s, %s, %s)
-                ''', (spreadsheet_id, i, data_str, data_hash))
-            else:
-                cursor.execute('''
-                    INSERT INTO raw_data (spreadsheet_id, row_number, data_json, data_hash)
-                    VALUES (?, ?, ?, ?)
-                ''', (spreadsheet_id, i, data_str, data_hash))
-
-        conn.commit()
-        conn.close()
-        print(f"💾 Saved {len(data)} rows for spreadsheet {spreadsheet_id}")
+        self.insert_raw_rows(spreadsheet_id, self.encode_raw_rows(spreadsheet_id, data))
     
     def create_extraction_job(self, job_name: str) -> int:
         """Create a new extraction job and return its ID."""
-        conn = self.db_connection.get_connection()
+        conn = self.get_connection()
         cursor = conn.cursor()
 
         if self.use_postgresql:
@@ -288,36 +527,52 @@ class ImprovedExtractor:
             job_id = cursor.lastrowid
 
         conn.commit()
-        conn.close()
         return job_id
     
     def update_extraction_job(self, job_id: int, **kwargs):
-        """Update extraction job progress."""
-        conn = self.db_connection.get_connection()
+        """
+        Update extraction job progress.
+
+        Only EXTRACTION_JOB_UPDATE_COLUMNS may be set. Every call runs the
+        same UPDATE text (unset columns keep their value via COALESCE), so
+        the connection's prepared-statement cache is reused.
+        """
+        unknown = set(kwargs) - set(EXTRACTION_JOB_UPDATE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown extraction job fields: {', '.join(sorted(unknown))}")
+
+        conn = self.get_connection()
         cursor = conn.cursor()
 
-        set_clauses = []
-        values = []
-
-        placeholder = '%s' if self.use_postgresql else '?'
-
-        for key, value in kwargs.items():
-            set_clauses.append(f"{key} = {placeholder}")
-            values.append(value)
-
-        if set_clauses:
-            values.append(job_id)
-            cursor.execute(f'''
-                UPDATE extraction_jobs
-                SET {", ".join(set_clauses)}
-                WHERE id = {placeholder}
-            ''', values)
+        values = [kwargs.get(column) for column in EXTRACTION_JOB_UPDATE_COLUMNS]
+        values.append(job_id)
+        cursor.execute(self._update_job_sql, values)
 
         conn.commit()
-        conn.close()
+
+    def record_progress(self, job_id: int, **kwargs):
+        """Buffer job progress in memory, writing it only if the flush interval has passed."""
+        self._dirty_progress.update(kwargs)
+        if time.monotonic() - self._last_progress_flush >= PROGRESS_FLUSH_INTERVAL_SECONDS:
+            self.flush_progress(job_id)
+
+    def flush_progress(self, job_id: int, **kwargs):
+        """Write buffered progress plus any extra fields in a single job update."""
+        self._dirty_progress.update(kwargs)
+        if self._dirty_progress:
+            self.update_extraction_job(job_id, **self._dirty_progress)
+            self._dirty_progress = {}
+        self._last_progress_flush = time.monotonic()
     
-    def extract_all_data(self):
-        """Extract data from all configured spreadsheets."""
+    def extract_all_data(self, on_spreadsheet_saved: Optional[Callable[[str], None]] = None):
+        """
+        Extract data from all configured spreadsheets.
+
+        Args:
+            on_spreadsheet_saved: Optional hook called with the spreadsheet ID as
+                soon as each spreadsheet's rows are committed, so downstream work
+                can start before the remaining downloads finish.
+        """
         print("🚀 Starting improved data extraction...")
         
         # Create database
@@ -326,71 +581,85 @@ class ImprovedExtractor:
         # Create extraction job
         job_name = f"improved_extraction_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         job_id = self.create_extraction_job(job_name)
+        self._dirty_progress = {}
+        self._last_progress_flush = time.monotonic()
         
         total_rows = 0
         processed_spreadsheets = 0
         successful_spreadsheets = 0
         
+        # Every sheet's rows are rewritten below; index them once at the end
+        self.drop_raw_data_indexes()
+        
         try:
-            for i, url in enumerate(self.sheet_urls, 1):
-                print(f"\n📊 Processing spreadsheet {i}/{len(self.sheet_urls)}")
-                print(f"🔗 URL: {url}")
-                
-                try:
-                    # Extract data
-                    data, title = self.download_sheet_data(url)
-                    processed_spreadsheets += 1
-                    
-                    if data:
-                        spreadsheet_id = self.extract_spreadsheet_id(url)
-                        
-                        # Determine sheet type based on title
-                        sheet_type = "unknown"
-                        title_lower = title.lower()
-                        if "survey" in title_lower:
-                            sheet_type = "survey"
-                        elif "assessment" in title_lower:
-                            sheet_type = "assessment"
-                        elif "inventory" in title_lower:
-                            sheet_type = "inventory"
-                        elif "intake" in title_lower:
-                            sheet_type = "intake"
-                        
-                        # Save spreadsheet info
-                        self.save_spreadsheet_info(spreadsheet_id, url, title, sheet_type)
-                        
-                        # Save raw data
-                        self.save_raw_data(spreadsheet_id, data)
-                        
-                        total_rows += len(data)
-                        successful_spreadsheets += 1
-                        
-                        print(f"✅ Successfully processed: {title}")
-                    else:
-                        print(f"⚠️  No data extracted from: {url}")
-                    
-                    # Update job progress
-                    self.update_extraction_job(
-                        job_id,
-                        processed_spreadsheets=processed_spreadsheets,
-                        successful_spreadsheets=successful_spreadsheets,
-                        total_rows=total_rows,
-                        processed_rows=total_rows
-                    )
-                    
-                    # Small delay between requests
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"❌ Error processing spreadsheet {i}: {e}")
-                    processed_spreadsheets += 1
-                    continue
+            # Downloads are network-bound and independent: fetch them all at
+            # once and save each one as soon as it arrives
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+                downloads = {
+                    executor.submit(self.download_sheet_data, url): (i, url)
+                    for i, url in enumerate(self.sheet_urls, 1)
+                }
+
+                for future in as_completed(downloads):
+                    i, url = downloads[future]
+                    print(f"\n📊 Processing spreadsheet {i}/{len(self.sheet_urls)}")
+                    print(f"🔗 URL: {url}")
+
+                    try:
+                        # Extract data
+                        data, title = future.result()
+                        processed_spreadsheets += 1
+
+                        if data:
+                            spreadsheet_id, _ = self.parse_sheet_url(url)
+
+                            # Determine sheet type based on title
+                            sheet_type = "unknown"
+                            title_lower = title.lower()
+                            if "survey" in title_lower:
+                                sheet_type = "survey"
+                            elif "assessment" in title_lower:
+                                sheet_type = "assessment"
+                            elif "inventory" in title_lower:
+                                sheet_type = "inventory"
+                            elif "intake" in title_lower:
+                                sheet_type = "intake"
+
+                            # Save spreadsheet info and raw data (already encoded by
+                            # the download worker) in one transaction
+                            total_rows += self.insert_raw_rows(
+                                spreadsheet_id, data, spreadsheet_info=(url, title, sheet_type)
+                            )
+                            successful_spreadsheets += 1
+
+                            if on_spreadsheet_saved:
+                                on_spreadsheet_saved(spreadsheet_id)
+
+                            print(f"✅ Successfully processed: {title}")
+                        else:
+                            print(f"⚠️  No data extracted from: {url}")
+
+                        # Update job progress (buffered; flushed periodically and at the end)
+                        self.record_progress(
+                            job_id,
+                            processed_spreadsheets=processed_spreadsheets,
+                            successful_spreadsheets=successful_spreadsheets,
+                            total_rows=total_rows,
+                            processed_rows=total_rows
+                        )
+
+                    except Exception as e:
+                        print(f"❌ Error processing spreadsheet {i}: {e}")
+                        # Shared connection: discard the failed sheet's partial writes
+                        self.get_connection().rollback()
+                        processed_spreadsheets += 1
+                        continue
             
             # Mark job as completed
-            self.update_extraction_job(
+            self.flush_progress(
                 job_id,
                 status='completed',
-                completed_at=datetime.now(),
+                completed_at=now_timestamp(),
                 processed_spreadsheets=processed_spreadsheets,
                 successful_spreadsheets=successful_spreadsheets,
                 total_rows=total_rows,
@@ -406,14 +675,17 @@ class ImprovedExtractor:
             
         except Exception as e:
             # Mark job as failed
-            self.update_extraction_job(
+            self.get_connection().rollback()
+            self.flush_progress(
                 job_id,
                 status='failed',
-                completed_at=datetime.now(),
+                completed_at=now_timestamp(),
                 error_message=str(e)
             )
             print(f"❌ Extraction failed: {e}")
             raise
+        finally:
+            self.create_raw_data_indexes()
     
     def show_database_info(self):
         """Show information about the database contents."""
@@ -421,7 +693,7 @@ class ImprovedExtractor:
             print(f"❌ Database not found: {self.db_path}")
             return
 
-        conn = self.db_connection.get_connection()
+        conn = self.get_connection()
         cursor = conn.cursor()
         
         print(f"\n📊 Database Information: {self.db_path}")
@@ -474,20 +746,74 @@ class ImprovedExtractor:
                 sheet_id, title, sheet_type, rows, synced = sheet
                 print(f"  • {sheet_id}: {title}")
                 print(f"    Type: {sheet_type} | Rows: {rows} | Last synced: {synced}")
-        
-        conn.close()
+
+
+def load_survey_normalizer():
+    """
+    Import SurveyNormalizer from src/normalizers, or return None if unavailable.
+
+    This script is run directly (sys.path[0] is src/extractors), so the
+    project root is put on sys.path to resolve the package import.
+    """
+    import sys
+
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+    try:
+        from src.normalizers.survey_normalizer import SurveyNormalizer
+    except ImportError as e:
+        print(f"⚠️  Survey normalizer unavailable ({e}) - extracting without normalization")
+        return None
+    return SurveyNormalizer
+
+
+def extract_and_normalize(extractor: ImprovedExtractor, normalizer_class):
+    """
+    Extract all spreadsheets, normalizing each one as soon as it is saved.
+
+    Normalization runs on a single background worker (the normalizer's writes
+    must stay serialized), so it overlaps the download of the next spreadsheet
+    instead of waiting for the whole extraction to finish.
+    """
+    normalizer = normalizer_class(source_db=extractor.db_path)
+    pending = []
+
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            def normalize_spreadsheet(spreadsheet_id: str):
+                # auto_import only picks up spreadsheets changed since the last sync
+                pending.append(executor.submit(normalizer.auto_import_new_data))
+
+            extractor.extract_all_data(on_spreadsheet_saved=normalize_spreadsheet)
+
+            for future in pending:
+                future.result()
+    finally:
+        normalizer.close()
 
 
 def main():
     """Main function to run the improved data extraction."""
+    import sys
+
     print("🔍 Improved Google Sheets Data Extractor")
     print("=" * 50)
-    
+
+    # --normalize pipelines normalization behind extraction
+    normalize = '--normalize' in sys.argv or '-n' in sys.argv
+
     extractor = ImprovedExtractor()
     
     try:
-        # Extract all data
-        extractor.extract_all_data()
+        # Extract all data; without the normalizer, plain extraction still
+        # runs and the caller's separate normalize step catches up
+        normalizer_class = load_survey_normalizer() if normalize else None
+        if normalizer_class:
+            extract_and_normalize(extractor, normalizer_class)
+        else:
+            extractor.extract_all_data()
         
         # Show database info
         extractor.show_database_info()
@@ -497,6 +823,8 @@ def main():
     except Exception as e:
         print(f"\n❌ Extraction failed: {e}")
         return 1
+    finally:
+        extractor.close()
     
     return 0
 
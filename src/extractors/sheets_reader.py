@@ -5,11 +5,23 @@ Reads data directly from Google Sheets into memory without database.
 """
 
 import csv
-import urllib.request
+import json
+import os
+import tempfile
+import threading
+import time
 import io
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+import httpx
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
 
 class SheetsReader:
     """Direct Google Sheets reader for in-memory storage."""
@@ -29,30 +41,197 @@ class SheetsReader:
         "OrgMaster": "601687640",    # Master list of all organizations reached out to
     }
 
+    # CSV export URL per tab name, built once below the class definition
+    _TAB_URLS: Dict[str, str] = {}
+
+    # On-disk cache of raw CSV exports, revalidated with ETag/Last-Modified
+    CACHE_DIR = os.getenv('SHEETS_CACHE_DIR', os.path.join('.cache', 'sheets'))
+    # Cached tabs younger than this are used without contacting Google at all
+    CACHE_MAX_AGE_SECONDS = int(os.getenv('SHEETS_CACHE_MAX_AGE', '300'))
+
+    # Shared keep-alive HTTP client so all tabs reuse one TLS connection
+    _client: Optional[httpx.Client] = None
+    _client_lock = threading.Lock()
+
+    @classmethod
+    def get_client(cls) -> httpx.Client:
+        """
+        Get (lazily creating) the pooled HTTP client used for downloads.
+
+        Server threads can call this concurrently, so creation is locked to
+        make sure only one client is ever built.
+        """
+        if cls._client is None:
+            with cls._client_lock:
+                if cls._client is None:
+                    cls._client = httpx.Client(
+                        headers={'User-Agent': 'Mozilla/5.0'},
+                        timeout=30,
+                        follow_redirects=True,
+                        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+                    )
+        return cls._client
+
     @staticmethod
     def get_csv_export_url(gid: str) -> str:
         """Get CSV export URL for a specific tab."""
         return f"https://docs.google.com/spreadsheets/d/{SheetsReader.SPREADSHEET_ID}/export?format=csv&gid={gid}"
 
     @staticmethod
-    def download_tab_data(tab_name: str, gid: str, verbose: bool = False) -> List[Dict[str, Any]]:
-        """Download data from a specific tab."""
+    def parse_csv(csv_bytes: bytes) -> List[Dict[str, Any]]:
+        """
+        Parse a UTF-8 CSV payload into a list of row dictionaries keyed by header.
+
+        Uses pandas' C parser when available and falls back to the csv module.
+        The payload is decoded incrementally by the parser rather than copied
+        into a full str first. Every row dict is zipped against one shared
+        header list, so header handling matches csv.DictReader and downstream
+        keys are identical.
+        """
+        if PANDAS_AVAILABLE:
+            try:
+                frame = pd.read_csv(
+                    io.BytesIO(csv_bytes),
+                    header=None,
+                    dtype=str,
+                    encoding='utf-8',
+                    keep_default_na=False,
+                    skip_blank_lines=True,
+                    engine='c'
+                )
+                if frame.empty:
+                    return []
+                header = list(frame.iloc[0])
+                return [
+                    dict(zip(header, values))
+                    for values in frame.iloc[1:].itertuples(index=False, name=None)
+                ]
+            except ValueError:
+                # Ragged or malformed rows: let the csv module handle them
+                pass
+
+        # csv.reader + zip skips DictReader's per-row field bookkeeping
+        text_stream = io.TextIOWrapper(io.BytesIO(csv_bytes), encoding='utf-8', newline='')
+        reader = csv.reader(text_stream)
+        header = next(reader, None)
+        if header is None:
+            return []
+        return [dict(zip(header, row)) for row in reader if row]
+
+    @classmethod
+    def _cache_paths(cls, gid: str) -> tuple:
+        """Return (csv_path, meta_path) for a tab's cache entry."""
+        return (os.path.join(cls.CACHE_DIR, f"{gid}.csv"),
+                os.path.join(cls.CACHE_DIR, f"{gid}.meta"))
+
+    @classmethod
+    def _read_cache(cls, gid: str) -> Optional[Dict[str, Any]]:
+        """Load a tab's cached CSV bytes and metadata, or None if missing."""
+        csv_path, meta_path = cls._cache_paths(gid)
         try:
-            csv_url = SheetsReader.get_csv_export_url(gid)
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            with open(csv_path, 'rb') as f:
+                meta['content'] = f.read()
+            return meta
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def _write_cache(cls, gid: str, csv_bytes: Optional[bytes], etag: Optional[str],
+                     last_modified: Optional[str]) -> None:
+        """
+        Persist a tab's CSV bytes (if given) and validators. Failures are non-fatal.
+
+        Each file is written to a temp file and renamed into place, CSV first,
+        so concurrent readers never see a truncated CSV or a fresh meta file
+        next to a stale CSV.
+        """
+        csv_path, meta_path = cls._cache_paths(gid)
+        try:
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
+            if csv_bytes is not None:
+                cls._replace_file(csv_path, csv_bytes)
+            cls._replace_file(meta_path, json.dumps({
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched_at': time.time()
+            }).encode('utf-8'))
+        except OSError:
+            pass
+
+    @classmethod
+    def _replace_file(cls, path: str, content: bytes) -> None:
+        """Atomically replace path with content via a temp file in CACHE_DIR."""
+        fd, tmp_path = tempfile.mkstemp(dir=cls.CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def download_tab_data(tab_name: str, gid: str, verbose: bool = False,
+                          max_age_seconds: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Download data from a specific tab.
+
+        Args:
+            tab_name: Tab name (for logging)
+            gid: Tab GID
+            verbose: Print progress
+            max_age_seconds: Serve the on-disk copy without a request if it is
+                younger than this (defaults to CACHE_MAX_AGE_SECONDS; 0 always
+                revalidates with Google)
+        """
+        if max_age_seconds is None:
+            max_age_seconds = SheetsReader.CACHE_MAX_AGE_SECONDS
+
+        try:
+            cached = SheetsReader._read_cache(gid)
+            if cached and time.time() - cached.get('fetched_at', 0) < max_age_seconds:
+                data = SheetsReader.parse_csv(cached['content'])
+                if verbose:
+                    print(f"  ✓ Loaded {len(data)} rows from cache for {tab_name}")
+                return data
+
+            csv_url = SheetsReader._TAB_URLS.get(tab_name) or SheetsReader.get_csv_export_url(gid)
             if verbose:
                 print(f"  Downloading {tab_name} from GID {gid}...")
 
-            # Create request with headers
-            req = urllib.request.Request(csv_url)
-            req.add_header('User-Agent', 'Mozilla/5.0')
+            # Conditional request headers from the cached copy
+            headers = {}
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
 
-            with urllib.request.urlopen(req, timeout=30) as response:
-                csv_data = response.read().decode('utf-8')
+            response = SheetsReader.get_client().get(csv_url, headers=headers)
+
+            if response.status_code == 304 and cached:
+                # Unchanged since last fetch: reuse cached copy
+                SheetsReader._write_cache(gid, None, cached.get('etag'),
+                                          cached.get('last_modified'))
+                data = SheetsReader.parse_csv(cached['content'])
+                if verbose:
+                    print(f"  ✓ {tab_name} unchanged, loaded {len(data)} rows from cache")
+                return data
+
+            response.raise_for_status()
+            csv_bytes = response.content
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
 
             # Parse CSV
-            if csv_data.strip() and not csv_data.startswith('<!DOCTYPE'):
-                csv_reader = csv.DictReader(io.StringIO(csv_data))
-                data = list(csv_reader)
+            if csv_bytes.strip() and not csv_bytes.startswith(b'<!DOCTYPE'):
+                data = SheetsReader.parse_csv(csv_bytes)
+                SheetsReader._write_cache(gid, csv_bytes, etag, last_modified)
                 if verbose:
                     print(f"  ✓ Downloaded {len(data)} rows from {tab_name}")
                 return data
@@ -67,10 +246,16 @@ class SheetsReader:
             return []
 
     @classmethod
-    def fetch_all_tabs(cls, verbose: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+    def fetch_all_tabs(cls, verbose: bool = False,
+                       max_age_seconds: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Fetch data from all tabs and return as dictionary.
 
+        Args:
+            verbose: Print progress
+            max_age_seconds: Maximum age of on-disk cached tabs to reuse without
+                revalidation (see download_tab_data)
+
         Returns:
             {
                 'Summary': [rows...],
@@ -100,7 +285,7 @@ class SheetsReader:
             if verbose:
                 print(f"[{tab_name}]")
 
-            data = cls.download_tab_data(tab_name, gid, verbose)
+            data = cls.download_tab_data(tab_name, gid, verbose, max_age_seconds)
             sheet_data[tab_name] = data
 
             if data:
@@ -126,6 +311,13 @@ class SheetsReader:
         return sheet_data
 
 
+# Tab URLs only depend on class constants, so format them once at import time
+SheetsReader._TAB_URLS = {
+    tab_name: SheetsReader.get_csv_export_url(gid)
+    for tab_name, gid in SheetsReader.TABS.items()
+}
+
+
 def main():
     """Main function to test reader."""
     data = SheetsReader.fetch_all_tabs(verbose=True)
@@ -9,17 +9,191 @@ Supports both SQLite (local) and PostgreSQL (production) via DATABASE_URL.
 """
 
 import sqlite3
+import functools
 import json
 import re
 import os
+import sys
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import hashlib
+import itertools
 import logging
+import threading
+from pathlib import Path
 from db_utils import DatabaseConnection, adapt_sql_for_postgresql, get_placeholder, is_postgresql
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Answer rows buffered before process_survey_responses writes them
+ANSWER_BATCH_SIZE = 5000
+
+# Answer values stored as answer_numeric (float() accepts exactly these)
+NUMERIC_ANSWER_RE = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)')
+# Answer values stored as answer_boolean
+BOOLEAN_ANSWERS = {
+    'true': True, 'yes': True, '1': True,
+    'false': False, 'no': False, '0': False,
+}
+BOOLEAN_ANSWER_MAX_LENGTH = max(map(len, BOOLEAN_ANSWERS))
+
+# Supported Date formats keyed by (contains '/', number of ':'). A value
+# can only match the format with its separators, so this picks the one
+# strptime call that can succeed
+DATE_FORMATS = {
+    (False, 2): '%Y-%m-%d %H:%M:%S',
+    (False, 1): '%Y-%m-%d %H:%M',
+    (False, 0): '%Y-%m-%d',
+    (True, 2): '%m/%d/%Y %H:%M:%S',
+    (True, 1): '%m/%d/%Y %H:%M',
+    (True, 0): '%m/%d/%Y',
+}
+
+# Hot INSERTs of process_survey_responses; formatted and adapted once per
+# normalizer so every call reuses the same statement text
+SQL_INSERT_QUESTION = '''
+    INSERT OR IGNORE INTO survey_questions
+    (survey_id, question_key, question_text, question_order)
+    VALUES ({ph}, {ph}, {ph}, {ph})
+'''
+SQL_INSERT_RESPONDENT = '''
+    INSERT OR IGNORE INTO respondents
+    (respondent_hash, browser, device, first_response_date, total_responses)
+    VALUES ({ph}, {ph}, {ph}, {ph}, 0)
+'''
+# Same insert returning the respondent's id whether or not it already
+# existed; the no-op DO UPDATE makes the conflicting row come back too
+SQL_UPSERT_RESPONDENT = '''
+    INSERT INTO respondents
+    (respondent_hash, browser, device, first_response_date, total_responses)
+    VALUES ({ph}, {ph}, {ph}, {ph}, 0)
+    ON CONFLICT (respondent_hash) DO UPDATE SET respondent_hash = excluded.respondent_hash
+    RETURNING id
+'''
+SQL_INSERT_ANSWERS = '''
+    INSERT INTO survey_answers
+    (response_id, question_id, answer_text, answer_numeric,
+     answer_boolean, is_empty)
+    VALUES {rows}
+'''
+
+# Recount total_responses and last_response_date of a survey's respondents
+# from survey_responses, run once per sheet after its rows are inserted. One
+# grouped pass over survey_responses instead of two correlated subqueries per
+# respondent, which would each scan the table while a full load has its
+# indexes dropped. Totals still span all of a respondent's surveys.
+SQL_REFRESH_RESPONDENT_STATS = '''
+    UPDATE respondents
+    SET total_responses = stats.response_count,
+        last_response_date = stats.last_response_date
+    FROM (
+        SELECT respondent_id,
+               COUNT(*) as response_count,
+               MAX(response_date) as last_response_date
+        FROM survey_responses
+        WHERE respondent_id IN (
+            SELECT respondent_id FROM survey_responses WHERE survey_id = {ph}
+        )
+        GROUP BY respondent_id
+    ) AS stats
+    WHERE respondents.id = stats.respondent_id
+'''
+
+# Same recount for SQLite before 3.33, which has no UPDATE ... FROM
+SQL_REFRESH_RESPONDENT_STATS_CORRELATED = '''
+    UPDATE respondents
+    SET total_responses = (
+            SELECT COUNT(*) FROM survey_responses
+            WHERE respondent_id = respondents.id
+        ),
+        last_response_date = (
+            SELECT MAX(response_date) FROM survey_responses
+            WHERE respondent_id = respondents.id
+        )
+    WHERE id IN (
+        SELECT respondent_id FROM survey_responses WHERE survey_id = {ph}
+    )
+'''
+
+# Source spreadsheets that are untracked (tracked_id IS NULL) or changed
+# since their last sync; {src} is the schema prefix of the source tables
+SQL_CHANGED_SHEETS = '''
+    SELECT
+        s.spreadsheet_id,
+        s.title,
+        s.sheet_type,
+        COUNT(r.id) as current_row_count,
+        t.id as tracked_id,
+        t.row_count as previous_count
+    FROM {src}spreadsheets s
+    LEFT JOIN {src}raw_data r ON s.spreadsheet_id = r.spreadsheet_id
+    LEFT JOIN sync_tracking t ON t.spreadsheet_id = s.spreadsheet_id
+    GROUP BY s.spreadsheet_id, s.title, s.sheet_type, s.last_synced,
+             t.id, t.last_sync_timestamp, t.row_count
+    HAVING t.id IS NULL
+        OR t.row_count IS NULL
+        OR COUNT(r.id) <> t.row_count
+        OR s.last_synced > t.last_sync_timestamp
+'''
+
+# INSERT ... RETURNING needs SQLite 3.35+ (PostgreSQL always has it)
+SQLITE_RETURNING_AVAILABLE = sqlite3.sqlite_version_info >= (3, 35, 0)
+# UPDATE ... FROM needs SQLite 3.33+ (PostgreSQL always has it)
+SQLITE_UPDATE_FROM_AVAILABLE = sqlite3.sqlite_version_info >= (3, 33, 0)
+
+# Answer rows per multi-row INSERT (50 x 6 = 300 bound parameters, well
+# under SQLite's 999 limit)
+ANSWERS_PER_INSERT = 50
+
+# Secondary indexes of the normalized schema. A full normalization builds
+# them after the bulk load so its INSERTs don't maintain them row by row
+NORMALIZED_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS idx_survey_questions_survey ON survey_questions(survey_id)',
+    'CREATE INDEX IF NOT EXISTS idx_survey_responses_survey ON survey_responses(survey_id)',
+    'CREATE INDEX IF NOT EXISTS idx_survey_responses_respondent ON survey_responses(respondent_id)',
+    'CREATE INDEX IF NOT EXISTS idx_survey_responses_date ON survey_responses(response_date)',
+    'CREATE INDEX IF NOT EXISTS idx_survey_answers_response ON survey_answers(response_id)',
+    'CREATE INDEX IF NOT EXISTS idx_survey_answers_question ON survey_answers(question_id)',
+    'CREATE INDEX IF NOT EXISTS idx_respondents_hash ON respondents(respondent_hash)',
+    'CREATE INDEX IF NOT EXISTS idx_respondents_first_response ON respondents(first_response_date)',
+)
+
+# Write-side settings for the SQLite target: WAL with synchronous=NORMAL
+# syncs once per checkpoint instead of twice per commit, and lets the
+# dashboard keep reading while an import runs
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_date(date_string: str) -> Optional[datetime]:
+    """Parse a survey Date value with the one format its shape allows."""
+    fmt = DATE_FORMATS.get(('/' in date_string, date_string.count(':')))
+    if fmt is None:
+        return None
+    try:
+        return datetime.strptime(date_string, fmt)
+    except ValueError:
+        return None
+
+
+def loads_row(data_json: str) -> Dict[str, Any]:
+    """Parse a raw_data row's data_json (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data_json)
+    return json.loads(data_json)
+
 
 class SurveyNormalizer:
     """Normalizes raw survey data into a proper relational structure."""
@@ -34,15 +208,97 @@ class SurveyNormalizer:
         self.target_db_connection = DatabaseConnection(target_db)
         self.use_postgresql = is_postgresql()
         self.placeholder = get_placeholder()
+        self._insert_question_sql = adapt_sql_for_postgresql(SQL_INSERT_QUESTION.format(ph=self.placeholder))
+        self._insert_respondent_sql = adapt_sql_for_postgresql(SQL_INSERT_RESPONDENT.format(ph=self.placeholder))
+        self._upsert_respondent_sql = None
+        if self.use_postgresql or SQLITE_RETURNING_AVAILABLE:
+            self._upsert_respondent_sql = SQL_UPSERT_RESPONDENT.format(ph=self.placeholder)
+        if self.use_postgresql or SQLITE_UPDATE_FROM_AVAILABLE:
+            self._refresh_respondent_stats_sql = SQL_REFRESH_RESPONDENT_STATS.format(ph=self.placeholder)
+        else:
+            self._refresh_respondent_stats_sql = SQL_REFRESH_RESPONDENT_STATS_CORRELATED.format(ph=self.placeholder)
+        self._answer_row_values = '({})'.format(', '.join([self.placeholder] * 6))
+        self._insert_answers_sql = self._answers_insert_sql(ANSWERS_PER_INSERT)
+
+        # SQLite connections kept open per (role, thread) until close(); see
+        # _get_source/_get_target
+        self._sqlite_connections: Dict[tuple, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
 
         if self.use_postgresql:
             logger.info("Normalizer using PostgreSQL database")
         else:
             logger.info(f"Normalizer using SQLite databases: source={source_db}, target={target_db}")
     
-    def create_normalized_schema(self):
-        """Create the normalized database schema for surveys."""
-        conn = self.target_db_connection.get_connection()
+    def _get_source(self):
+        """
+        Get a connection to the source database.
+
+        On SQLite this is a read-only connection kept open for the calling
+        thread and reused by every method; PostgreSQL opens a new connection
+        per call. Hand it back with _release().
+        """
+        if self.use_postgresql:
+            return self.source_db_connection.get_connection()
+        return self._get_sqlite_connection('source')
+
+    def _get_target(self):
+        """
+        Get a connection to the target database.
+
+        On SQLite this is kept open for the calling thread with the write
+        PRAGMAs applied; PostgreSQL opens a new connection per call. Hand it
+        back with _release().
+        """
+        if self.use_postgresql:
+            return self.target_db_connection.get_connection()
+        return self._get_sqlite_connection('target')
+
+    def _get_sqlite_connection(self, role: str) -> sqlite3.Connection:
+        """Open (once per thread) the source or target SQLite connection."""
+        key = (role, threading.get_ident())
+        with self._connections_lock:
+            conn = self._sqlite_connections.get(key)
+            if conn is None:
+                if role == 'source':
+                    conn = sqlite3.connect(self._source_uri(), uri=True, check_same_thread=False)
+                else:
+                    # uri=True only affects names starting with file:, which
+                    # lets check_for_new_data attach the source read-only
+                    conn = sqlite3.connect(self.target_db, uri=True, check_same_thread=False)
+                    for pragma in SQLITE_PRAGMAS:
+                        conn.execute(pragma)
+                conn.row_factory = sqlite3.Row
+                self._sqlite_connections[key] = conn
+        return conn
+
+    def _source_uri(self) -> str:
+        """Read-only URI of the SQLite source database."""
+        return Path(self.source_db).resolve().as_uri() + '?mode=ro'
+
+    def _release(self, conn):
+        """Finish with a connection from _get_source/_get_target."""
+        if self.use_postgresql:
+            conn.close()
+        elif conn.in_transaction:
+            # Uncommitted work is discarded, as closing the connection did
+            conn.rollback()
+
+    def close(self):
+        """Close the SQLite connections kept open for all threads."""
+        with self._connections_lock:
+            connections = list(self._sqlite_connections.values())
+            self._sqlite_connections.clear()
+        for conn in connections:
+            conn.close()
+
+    def create_normalized_schema(self, with_indexes: bool = True):
+        """Create the normalized database schema for surveys.
+
+        Pass with_indexes=False before a bulk load and call create_indexes()
+        once the data is in.
+        """
+        conn = self._get_target()
         cursor = conn.cursor()
 
         # Drop existing tables if they exist (reverse order due to foreign keys)
@@ -51,14 +307,23 @@ class SurveyNormalizer:
             'surveys', 'respondents', 'normalization_jobs', 'sync_tracking'
         ]
 
+        # DDL is collected and sent to SQLite in one executescript() call
+        statements = []
+
+        if not self.use_postgresql:
+            # SurveyAnalytics' full-text index over survey_answers would go
+            # stale once the table is recreated (its triggers are dropped with
+            # it); drop it too so search rebuilds it from the new rows
+            statements.append('DROP TABLE IF EXISTS survey_answers_fts')
+
         for table in tables_to_drop:
             if self.use_postgresql:
-                cursor.execute(f'DROP TABLE IF EXISTS {table} CASCADE')
+                statements.append(f'DROP TABLE IF EXISTS {table} CASCADE')
             else:
-                cursor.execute(f'DROP TABLE IF EXISTS {table}')
+                statements.append(f'DROP TABLE IF EXISTS {table}')
         
         # Create surveys table
-        cursor.execute(adapt_sql_for_postgresql('''
+        statements.append(adapt_sql_for_postgresql('''
             CREATE TABLE surveys (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 survey_name TEXT NOT NULL,
@@ -72,7 +337,7 @@ class SurveyNormalizer:
         '''))
 
         # Create survey questions table
-        cursor.execute(adapt_sql_for_postgresql('''
+        statements.append(adapt_sql_for_postgresql('''
             CREATE TABLE survey_questions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 survey_id INTEGER NOT NULL,
@@ -88,7 +353,7 @@ class SurveyNormalizer:
         '''))
 
         # Create respondents table
-        cursor.execute(adapt_sql_for_postgresql('''
+        statements.append(adapt_sql_for_postgresql('''
             CREATE TABLE respondents (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 respondent_hash TEXT UNIQUE NOT NULL,
@@ -104,7 +369,7 @@ class SurveyNormalizer:
         '''))
 
         # Create survey responses table
-        cursor.execute(adapt_sql_for_postgresql('''
+        statements.append(adapt_sql_for_postgresql('''
             CREATE TABLE survey_responses (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 survey_id INTEGER NOT NULL,
@@ -120,7 +385,7 @@ class SurveyNormalizer:
         '''))
 
         # Create survey answers table
-        cursor.execute(adapt_sql_for_postgresql('''
+        statements.append(adapt_sql_for_postgresql('''
             CREATE TABLE survey_answers (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 response_id INTEGER NOT NULL,
@@ -138,7 +403,7 @@ class SurveyNormalizer:
         '''))
 
         # Create normalization jobs table
-        cursor.execute(adapt_sql_for_postgresql('''
+        statements.append(adapt_sql_for_postgresql('''
             CREATE TABLE normalization_jobs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 job_name TEXT NOT NULL,
@@ -154,7 +419,7 @@ class SurveyNormalizer:
         '''))
 
         # Create sync tracking table
-        cursor.execute(adapt_sql_for_postgresql('''
+        statements.append(adapt_sql_for_postgresql('''
             CREATE TABLE sync_tracking (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 spreadsheet_id TEXT UNIQUE NOT NULL,
@@ -167,30 +432,38 @@ class SurveyNormalizer:
             )
         '''))
         
-        # Create indexes for performance
-        indexes = [
-            'CREATE INDEX idx_survey_questions_survey ON survey_questions(survey_id)',
-            'CREATE INDEX idx_survey_responses_survey ON survey_responses(survey_id)',
-            'CREATE INDEX idx_survey_responses_respondent ON survey_responses(respondent_id)',
-            'CREATE INDEX idx_survey_responses_date ON survey_responses(response_date)',
-            'CREATE INDEX idx_survey_answers_response ON survey_answers(response_id)',
-            'CREATE INDEX idx_survey_answers_question ON survey_answers(question_id)',
-            'CREATE INDEX idx_respondents_hash ON respondents(respondent_hash)',
-            'CREATE INDEX idx_respondents_first_response ON respondents(first_response_date)'
-        ]
-        
-        for index_sql in indexes:
-            cursor.execute(index_sql)
-        
+        if self.use_postgresql:
+            for statement in statements:
+                cursor.execute(statement)
+        else:
+            cursor.executescript(';\n'.join(statements))
+
         conn.commit()
-        conn.close()
+        self._release(conn)
+
+        if with_indexes:
+            self.create_indexes()
 
         db_type = "PostgreSQL" if self.use_postgresql else f"SQLite ({self.target_db})"
         print(f"✅ Created normalized database schema: {db_type}")
 
+    def create_indexes(self):
+        """Create the secondary indexes of the normalized schema (idempotent)."""
+        conn = self._get_target()
+        cursor = conn.cursor()
+
+        if self.use_postgresql:
+            for index_sql in NORMALIZED_INDEXES:
+                cursor.execute(index_sql)
+        else:
+            cursor.executescript(';\n'.join(NORMALIZED_INDEXES))
+
+        conn.commit()
+        self._release(conn)
+
     def identify_survey_types(self) -> Dict[str, str]:
         """Identify which spreadsheets contain survey data vs. question definitions."""
-        conn = self.source_db_connection.get_connection()
+        conn = self._get_source()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -233,9 +506,9 @@ class SurveyNormalizer:
                 # Check if this looks like response data or question data
                 # Extract JSON from row (handling dict vs tuple)
                 if isinstance(sample_rows[0], dict):
-                    sample_data = json.loads(sample_rows[0]['data_json'])
+                    sample_data = loads_row(sample_rows[0]['data_json'])
                 else:
-                    sample_data = json.loads(sample_rows[0][0])
+                    sample_data = loads_row(sample_rows[0][0])
 
                 # Look for response indicators
                 response_indicators = ['Date', 'Browser', 'Device', 'Timestamp']
@@ -255,7 +528,7 @@ class SurveyNormalizer:
             else:
                 survey_types[sheet_id] = 'unknown'
 
-        conn.close()
+        self._release(conn)
         return survey_types
     
     def create_respondent_hash(self, response_data: Dict) -> str:
@@ -274,23 +547,7 @@ class SurveyNormalizer:
         """Parse various date formats from the survey data."""
         if not date_string:
             return None
-        
-        date_formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M',
-            '%m/%d/%Y %H:%M:%S',
-            '%m/%d/%Y %H:%M',
-            '%Y-%m-%d',
-            '%m/%d/%Y'
-        ]
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_string, fmt)
-            except ValueError:
-                continue
-        
-        return None
+        return parse_date(date_string)
 
     def check_for_new_data(self) -> Dict[str, Any]:
         """Check for new or updated data in the source database."""
@@ -298,10 +555,7 @@ class SurveyNormalizer:
         if not self.use_postgresql and not os.path.exists(self.target_db):
             self.create_normalized_schema()
 
-        source_conn = self.source_db_connection.get_connection()
-        source_cursor = source_conn.cursor()
-
-        target_conn = self.target_db_connection.get_connection()
+        target_conn = self._get_target()
         target_cursor = target_conn.cursor()
 
         # Ensure sync_tracking table exists
@@ -318,72 +572,44 @@ class SurveyNormalizer:
             )
         '''))
 
-        # Get current state from source
-        source_cursor.execute('''
-            SELECT
-                s.spreadsheet_id,
-                s.title,
-                s.sheet_type,
-                s.last_synced,
-                COUNT(r.id) as current_row_count
-            FROM spreadsheets s
-            LEFT JOIN raw_data r ON s.spreadsheet_id = r.spreadsheet_id
-            GROUP BY s.spreadsheet_id, s.title, s.sheet_type, s.last_synced
-        ''')
-
-        source_data = source_cursor.fetchall()
-
-        # Get sync tracking state (handle dict vs tuple)
-        target_cursor.execute('SELECT spreadsheet_id, last_sync_timestamp, row_count FROM sync_tracking')
-        sync_rows = target_cursor.fetchall()
-        sync_state = {}
-        for row in sync_rows:
-            if isinstance(row, dict):
-                sync_state[row['spreadsheet_id']] = {
-                    'last_sync': row['last_sync_timestamp'],
-                    'row_count': row['row_count']
-                }
-            else:
-                sync_state[row[0]] = {'last_sync': row[1], 'row_count': row[2]}
+        # Compare source sheets with sync_tracking in one query; only new and
+        # changed sheets come back. On SQLite the source database is attached
+        # to the target connection for it (PostgreSQL has both in one database)
+        if self.use_postgresql:
+            target_cursor.execute(SQL_CHANGED_SHEETS.format(src=''))
+            changed_sheets = target_cursor.fetchall()
+        else:
+            target_cursor.execute('ATTACH DATABASE ? AS src', (self._source_uri(),))
+            try:
+                target_cursor.execute(SQL_CHANGED_SHEETS.format(src='src.'))
+                changed_sheets = target_cursor.fetchall()
+            finally:
+                target_cursor.execute('DETACH DATABASE src')
 
         new_data = []
         updated_data = []
 
-        for sheet in source_data:
-            # Handle dict vs tuple result
-            if isinstance(sheet, dict):
-                sheet_id = sheet['spreadsheet_id']
-                title = sheet['title']
-                sheet_type = sheet['sheet_type']
-                last_synced = sheet['last_synced']
-                row_count = sheet['current_row_count']
-            else:
-                sheet_id, title, sheet_type, last_synced, row_count = sheet
-            if sheet_id not in sync_state:
+        for sheet in changed_sheets:
+            if sheet['tracked_id'] is None:
                 # New spreadsheet
                 new_data.append({
-                    'spreadsheet_id': sheet_id,
-                    'title': title,
-                    'sheet_type': sheet_type,
-                    'row_count': row_count,
+                    'spreadsheet_id': sheet['spreadsheet_id'],
+                    'title': sheet['title'],
+                    'sheet_type': sheet['sheet_type'],
+                    'row_count': sheet['current_row_count'],
                     'status': 'new'
                 })
             else:
-                # Check if updated
-                sync_info = sync_state[sheet_id]
-                if (row_count != sync_info['row_count'] or
-                    (last_synced and sync_info['last_sync'] and last_synced > sync_info['last_sync'])):
-                    updated_data.append({
-                        'spreadsheet_id': sheet_id,
-                        'title': title,
-                        'sheet_type': sheet_type,
-                        'row_count': row_count,
-                        'previous_count': sync_info['row_count'],
-                        'status': 'updated'
-                    })
-
-        source_conn.close()
-        target_conn.close()
+                updated_data.append({
+                    'spreadsheet_id': sheet['spreadsheet_id'],
+                    'title': sheet['title'],
+                    'sheet_type': sheet['sheet_type'],
+                    'row_count': sheet['current_row_count'],
+                    'previous_count': sheet['previous_count'],
+                    'status': 'updated'
+                })
+
+        self._release(target_conn)
 
         return {
             'new_data': new_data,
@@ -406,12 +632,13 @@ class SurveyNormalizer:
         # Import new and updated data
         imported_count = 0
         updated_count = 0
+        survey_types = self.identify_survey_types()
 
         # Process new data
         for item in changes['new_data']:
             print(f"  📥 Importing new: {item['title']} ({item['row_count']} rows)")
             try:
-                self.import_single_spreadsheet(item['spreadsheet_id'])
+                self.import_single_spreadsheet(item['spreadsheet_id'], survey_types=survey_types)
                 imported_count += 1
             except Exception as e:
                 print(f"    ❌ Failed to import {item['title']}: {e}")
@@ -420,7 +647,7 @@ class SurveyNormalizer:
         for item in changes['updated_data']:
             print(f"  🔄 Updating: {item['title']} ({item['previous_count']} → {item['row_count']} rows)")
             try:
-                self.import_single_spreadsheet(item['spreadsheet_id'], update=True)
+                self.import_single_spreadsheet(item['spreadsheet_id'], update=True, survey_types=survey_types)
                 updated_count += 1
             except Exception as e:
                 print(f"    ❌ Failed to update {item['title']}: {e}")
@@ -432,15 +659,44 @@ class SurveyNormalizer:
             'message': f"Successfully processed {imported_count + updated_count} spreadsheets"
         }
 
+        if result['total_processed']:
+            self.refresh_analytics()
+
         print(f"✅ Auto-import completed: {result['message']}")
         return result
 
-    def import_single_spreadsheet(self, spreadsheet_id: str, update: bool = False):
-        """Import or update a single spreadsheet."""
-        source_conn = self.source_db_connection.get_connection()
+    def refresh_analytics(self):
+        """Recompute SurveyAnalytics' per-survey stats table after an import (best effort)."""
+        # Resolve the package import when run as a script from src/normalizers
+        project_root = str(Path(__file__).resolve().parents[2])
+        if project_root not in sys.path:
+            sys.path.insert(0, project_root)
+        try:
+            from src.analytics.survey_analytics import SurveyAnalytics
+        except ImportError as e:
+            print(f"⚠️  Could not import SurveyAnalytics, analytics stats not refreshed: {e}")
+            return
+
+        analytics = SurveyAnalytics(self.target_db, use_postgresql=self.use_postgresql)
+        try:
+            analytics.refresh_materialized_views()
+        except Exception as e:
+            print(f"⚠️  Could not refresh analytics stats: {e}")
+        finally:
+            analytics.close()
+
+    def import_single_spreadsheet(self, spreadsheet_id: str, update: bool = False,
+                                  survey_types: Optional[Dict[str, str]] = None):
+        """
+        Import or update a single spreadsheet.
+
+        survey_types is the result of identify_survey_types(); callers importing
+        several spreadsheets pass it in so it is computed once, not per sheet.
+        """
+        source_conn = self._get_source()
         source_cursor = source_conn.cursor()
 
-        target_conn = self.target_db_connection.get_connection()
+        target_conn = self._get_target()
         target_cursor = target_conn.cursor()
 
         try:
@@ -473,7 +729,8 @@ class SurveyNormalizer:
                 sheet_id, title, sheet_type, url, last_synced = sheet_info
 
             # Determine survey type
-            survey_types = self.identify_survey_types()
+            if survey_types is None:
+                survey_types = self.identify_survey_types()
             survey_data_type = survey_types.get(sheet_id, 'responses')
 
             if survey_data_type == 'responses':
@@ -508,6 +765,11 @@ class SurveyNormalizer:
                 print(f"    ⚠️  Skipping {title} (question definitions, not responses)")
 
         except Exception as e:
+            # Discard the partial import so an update leaves the previously
+            # imported data in place; the sheet's clear and re-import only
+            # become visible together at the commit above
+            target_conn.rollback()
+
             # Update sync tracking with error (adapt SQL for PostgreSQL)
             error_sync_sql = adapt_sql_for_postgresql('''
                 INSERT OR REPLACE INTO sync_tracking
@@ -520,8 +782,8 @@ class SurveyNormalizer:
             raise e
 
         finally:
-            source_conn.close()
-            target_conn.close()
+            self._release(source_conn)
+            self._release(target_conn)
 
     def clear_spreadsheet_data(self, target_cursor, spreadsheet_id: str):
         """Clear existing data for a spreadsheet before re-importing."""
@@ -570,18 +832,19 @@ class SurveyNormalizer:
         """Main method to normalize all survey data."""
         print("🔄 Starting survey data normalization...")
 
-        # Create normalized schema
-        self.create_normalized_schema()
+        # Create normalized schema; indexes are built after the bulk load
+        self.create_normalized_schema(with_indexes=False)
 
         # Auto-import new data if enabled
         if self.auto_import:
             auto_result = self.auto_import_new_data()
             if auto_result['total_processed'] > 0:
+                self.create_indexes()
                 print(f"📥 Auto-imported {auto_result['total_processed']} spreadsheets")
                 return auto_result
         
         # Create normalization job
-        target_conn = self.target_db_connection.get_connection()
+        target_conn = self._get_target()
         target_cursor = target_conn.cursor()
 
         job_name = f"normalization_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -608,7 +871,7 @@ class SurveyNormalizer:
             print(f"📊 Identified survey types: {survey_types}")
             
             # Process each spreadsheet
-            source_conn = self.source_db_connection.get_connection()
+            source_conn = self._get_source()
             source_cursor = source_conn.cursor()
             
             # Get all spreadsheets
@@ -661,6 +924,8 @@ class SurveyNormalizer:
                   questions_created, answers_created, job_id))
             
             target_conn.commit()
+            self.create_indexes()
+            self.refresh_analytics()
             
             print(f"\n✅ Normalization completed successfully!")
             print(f"📈 Surveys processed: {surveys_processed}")
@@ -678,13 +943,38 @@ class SurveyNormalizer:
                 WHERE id = ?
             ''', (datetime.now(), str(e), job_id))
             target_conn.commit()
+            self.create_indexes()
             print(f"❌ Normalization failed: {e}")
             raise
         
         finally:
-            source_conn.close()
-            target_conn.close()
+            self._release(source_conn)
+            self._release(target_conn)
     
+    def _answers_insert_sql(self, row_count: int) -> str:
+        """Build a survey_answers INSERT with row_count VALUES tuples."""
+        return SQL_INSERT_ANSWERS.format(rows=', '.join([self._answer_row_values] * row_count))
+
+    def insert_answers(self, target_cursor, answers: List[tuple]):
+        """
+        Insert answer tuples ANSWERS_PER_INSERT rows per statement.
+
+        Full chunks share one prepared multi-row INSERT via executemany; the
+        leftover rows go in a single shorter INSERT.
+        """
+        full_rows = len(answers) - len(answers) % ANSWERS_PER_INSERT
+        if full_rows:
+            target_cursor.executemany(self._insert_answers_sql, (
+                [value for answer in answers[start:start + ANSWERS_PER_INSERT] for value in answer]
+                for start in range(0, full_rows, ANSWERS_PER_INSERT)
+            ))
+        if full_rows < len(answers):
+            leftover = answers[full_rows:]
+            target_cursor.execute(
+                self._answers_insert_sql(len(leftover)),
+                [value for answer in leftover for value in answer]
+            )
+
     def process_survey_responses(self, source_cursor, target_cursor, sheet_id: str,
                                title: str, sheet_type: str) -> Dict[str, int]:
         """Process survey response data from a spreadsheet."""
@@ -725,36 +1015,52 @@ class SurveyNormalizer:
                 ORDER BY row_number
             ''', (sheet_id,))
         
-        raw_rows = source_cursor.fetchall()
+        # Rows are streamed from the cursor rather than fetched all at once;
+        # the first one is read ahead to discover the questions
+        first_row = source_cursor.fetchone()
 
-        if not raw_rows:
+        if first_row is None:
             return {'responses': 0, 'questions': 0, 'answers': 0}
 
+        raw_rows = itertools.chain((first_row,), source_cursor)
+
         # Analyze first row to identify questions (handle dict vs tuple)
-        if isinstance(raw_rows[0], dict):
-            first_row_data = json.loads(raw_rows[0]['data_json'])
+        if isinstance(first_row, dict):
+            first_row_data = loads_row(first_row['data_json'])
         else:
-            first_row_data = json.loads(raw_rows[0][2])
+            first_row_data = loads_row(first_row[2])
         question_keys = [key for key in first_row_data.keys() 
                         if not key.startswith('_') and key not in ['Date', 'Browser', 'Device']]
         
         questions_created = 0
         
-        # Create question records (adapt SQL for PostgreSQL)
+        # Create question records
         for i, question_key in enumerate(question_keys):
-            insert_question_sql = adapt_sql_for_postgresql('''
-                INSERT OR IGNORE INTO survey_questions
-                (survey_id, question_key, question_text, question_order)
-                VALUES ({}, {}, {}, {})
-            '''.format(*[self.placeholder]*4))
-
-            target_cursor.execute(insert_question_sql, (survey_id, question_key, question_key, i + 1))
+            target_cursor.execute(self._insert_question_sql, (survey_id, question_key, question_key, i + 1))
 
             if target_cursor.rowcount > 0:
                 questions_created += 1
+
+        # Map question keys to ids once instead of looking one up per answer
+        target_cursor.execute('''
+            SELECT question_key, id FROM survey_questions WHERE survey_id = {}
+        '''.format(self.placeholder), (survey_id,))
+        question_ids = {}
+        for question_row in target_cursor.fetchall():
+            # Handle dict vs tuple result
+            if isinstance(question_row, dict):
+                question_ids[question_row['question_key']] = question_row['id']
+            else:
+                question_ids[question_row[0]] = question_row[1]
+
+        # Respondent ids by hash, filled as respondents are first seen
+        respondent_ids = {}
         
         responses_processed = 0
         answers_created = 0
+
+        # Answers are buffered and written in multi-row INSERTs
+        answer_batch = []
         
         # Process each response
         for row in raw_rows:
@@ -767,51 +1073,31 @@ class SurveyNormalizer:
                 else:
                     row_id, row_number, data_json = row
 
-                response_data = json.loads(data_json)
+                response_data = loads_row(data_json)
+                response_date = self.parse_response_date(response_data.get('Date', ''))
                 
-                # Create or get respondent (adapt SQL for PostgreSQL)
+                # Create or get respondent
                 respondent_hash = self.create_respondent_hash(response_data)
-
-                insert_respondent_sql = adapt_sql_for_postgresql('''
-                    INSERT OR IGNORE INTO respondents
-                    (respondent_hash, browser, device, first_response_date, total_responses)
-                    VALUES ({}, {}, {}, {}, 1)
-                '''.format(*[self.placeholder]*4))
-
-                target_cursor.execute(insert_respondent_sql, (
-                    respondent_hash,
-                    response_data.get('Browser', ''),
-                    response_data.get('Device', ''),
-                    self.parse_response_date(response_data.get('Date', ''))
-                ))
-
-                # Update respondent stats (use proper placeholder)
-                if self.use_postgresql:
-                    target_cursor.execute('''
-                        UPDATE respondents
-                        SET last_response_date = %s,
-                            total_responses = total_responses + 1
-                        WHERE respondent_hash = %s
-                    ''', (self.parse_response_date(response_data.get('Date', '')), respondent_hash))
-                else:
-                    target_cursor.execute('''
-                        UPDATE respondents
-                        SET last_response_date = ?,
-                            total_responses = total_responses + 1
-                        WHERE respondent_hash = ?
-                    ''', (self.parse_response_date(response_data.get('Date', '')), respondent_hash))
-
-                # Get respondent ID (use proper placeholder)
-                if self.use_postgresql:
-                    target_cursor.execute('''
-                        SELECT id FROM respondents WHERE respondent_hash = %s
-                    ''', (respondent_hash,))
-                    respondent_id = target_cursor.fetchone()['id']
-                else:
-                    target_cursor.execute('''
-                        SELECT id FROM respondents WHERE respondent_hash = ?
-                    ''', (respondent_hash,))
-                    respondent_id = target_cursor.fetchone()[0]
+                respondent_id = respondent_ids.get(respondent_hash)
+
+                if respondent_id is None:
+                    respondent_values = (
+                        respondent_hash,
+                        response_data.get('Browser', ''),
+                        response_data.get('Device', ''),
+                        response_date
+                    )
+                    if self._upsert_respondent_sql:
+                        target_cursor.execute(self._upsert_respondent_sql, respondent_values)
+                        respondent_id = target_cursor.fetchone()['id']
+                    else:
+                        # SQLite before 3.35: insert, then look the ID up
+                        target_cursor.execute(self._insert_respondent_sql, respondent_values)
+                        target_cursor.execute('''
+                            SELECT id FROM respondents WHERE respondent_hash = ?
+                        ''', (respondent_hash,))
+                        respondent_id = target_cursor.fetchone()[0]
+                    respondent_ids[respondent_hash] = respondent_id
                 
                 # Create response record (use proper placeholder and RETURNING)
                 if self.use_postgresql:
@@ -822,7 +1108,7 @@ class SurveyNormalizer:
                     ''', (
                         survey_id,
                         respondent_id,
-                        self.parse_response_date(response_data.get('Date', '')),
+                        response_date,
                         row_id
                     ))
                     response_id = target_cursor.fetchone()['id']
@@ -834,7 +1120,7 @@ class SurveyNormalizer:
                     ''', (
                         survey_id,
                         respondent_id,
-                        self.parse_response_date(response_data.get('Date', '')),
+                        response_date,
                         row_id
                     ))
                     response_id = target_cursor.lastrowid
@@ -843,73 +1129,47 @@ class SurveyNormalizer:
                 
                 # Create answer records
                 for question_key in question_keys:
-                    # Get question ID (use proper placeholder)
-                    if self.use_postgresql:
-                        target_cursor.execute('''
-                            SELECT id FROM survey_questions
-                            WHERE survey_id = %s AND question_key = %s
-                        ''', (survey_id, question_key))
-                    else:
-                        target_cursor.execute('''
-                            SELECT id FROM survey_questions
-                            WHERE survey_id = ? AND question_key = ?
-                        ''', (survey_id, question_key))
-
-                    question_result = target_cursor.fetchone()
-                    if not question_result:
+                    question_id = question_ids.get(question_key)
+                    if question_id is None:
                         continue
 
-                    # Handle dict vs tuple result
-                    if isinstance(question_result, dict):
-                        question_id = question_result['id']
-                    else:
-                        question_id = question_result[0]
                     answer_value = response_data.get(question_key, '')
                     
                     # Parse answer value
-                    answer_text = str(answer_value) if answer_value else None
+                    value_text = str(answer_value)
+                    is_empty = not answer_value
+                    answer_text = None if is_empty else value_text
+
+                    # Numeric: digits with an optional leading '-' and one '.'
                     answer_numeric = None
-                    answer_boolean = None
-                    is_empty = not bool(answer_value)
-                    
-                    # Try to parse as numeric
-                    if answer_value and str(answer_value).replace('.', '').replace('-', '').isdigit():
-                        try:
-                            answer_numeric = float(answer_value)
-                        except ValueError:
-                            pass
-                    
-                    # Try to parse as boolean
-                    if str(answer_value).lower() in ['true', 'false', 'yes', 'no', '1', '0']:
-                        answer_boolean = str(answer_value).lower() in ['true', 'yes', '1']
+                    if not is_empty and NUMERIC_ANSWER_RE.fullmatch(value_text):
+                        answer_numeric = float(value_text)
 
-                    # Insert answer (use proper placeholder)
-                    if self.use_postgresql:
-                        target_cursor.execute('''
-                            INSERT INTO survey_answers
-                            (response_id, question_id, answer_text, answer_numeric,
-                             answer_boolean, is_empty)
-                            VALUES (%s, %s, %s, %s, %s, %s)
-                        ''', (
-                            response_id, question_id, answer_text, answer_numeric,
-                            answer_boolean, is_empty
-                        ))
-                    else:
-                        target_cursor.execute('''
-                            INSERT INTO survey_answers
-                            (response_id, question_id, answer_text, answer_numeric,
-                             answer_boolean, is_empty)
-                            VALUES (?, ?, ?, ?, ?, ?)
-                        ''', (
-                            response_id, question_id, answer_text, answer_numeric,
-                            answer_boolean, is_empty
-                        ))
+                    # Boolean: true/yes/1 or false/no/0, any case; longer free
+                    # text is not lowercased just to miss the lookup
+                    answer_boolean = None
+                    if len(value_text) <= BOOLEAN_ANSWER_MAX_LENGTH:
+                        answer_boolean = BOOLEAN_ANSWERS.get(value_text.lower())
 
+                    answer_batch.append((
+                        response_id, question_id, answer_text, answer_numeric,
+                        answer_boolean, is_empty
+                    ))
                     answers_created += 1
                 
             except Exception as e:
                 print(f"  ⚠️  Error processing row {row_number}: {e}")
                 continue
+
+            if len(answer_batch) >= ANSWER_BATCH_SIZE:
+                self.insert_answers(target_cursor, answer_batch)
+                answer_batch = []
+
+        if answer_batch:
+            self.insert_answers(target_cursor, answer_batch)
+
+        # Respondent stats in one pass once the sheet's responses are in
+        target_cursor.execute(self._refresh_respondent_stats_sql, (survey_id,))
         
         print(f"  ✅ Processed {responses_processed} responses, {questions_created} questions, {answers_created} answers")
         
@@ -959,6 +1219,9 @@ def main():
             print(f"\n❌ Auto-import failed: {e}")
             return 1
 
+        finally:
+            normalizer.close()
+
     else:
         # Full normalization mode
         if force_full:
@@ -976,6 +1239,9 @@ def main():
             print(f"\n❌ Normalization failed: {e}")
             return 1
 
+        finally:
+            normalizer.close()
+
     return 0
 
 
@@ -24,6 +24,7 @@ class ReportGenerator:
         """
         self.sheet_data = sheet_data
         self.questions_lookup = self._build_questions_lookup()
+        self.records_by_org = self._build_records_by_org()
         self.rubric = MaturityRubric()
         self.enable_ai = enable_ai
 
@@ -60,6 +61,28 @@ class ReportGenerator:
 
         return questions
 
+    def _build_records_by_org(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Index Intake/CEO/Tech/Staff rows by organization name, in sheet order."""
+        org_columns = {
+            "Intake": "Organization Name:",
+            "CEO": "CEO Organization",
+            "Tech": "Organization",
+            "Staff": "Organization",
+        }
+
+        records_by_org = {}
+        for tab_name, org_column in org_columns.items():
+            tab_index = defaultdict(list)
+            for row in self.sheet_data.get(tab_name, []):
+                tab_index[row.get(org_column)].append(row)
+            records_by_org[tab_name] = dict(tab_index)
+
+        return records_by_org
+
+    def _org_records(self, tab_name: str, org_name: str) -> List[Dict[str, Any]]:
+        """Rows of a tab belonging to an organization."""
+        return self.records_by_org[tab_name].get(org_name, [])
+
     def _extract_numeric_responses(self, record: Dict[str, Any]) -> Dict[str, float]:
         """Extract numeric responses (ignoring text/open-ended)."""
         numeric_responses = {}
@@ -89,31 +112,19 @@ class ReportGenerator:
             Dictionary containing report data with maturity assessment
         """
         # Find intake record
-        intake_data = self.sheet_data.get("Intake", [])
-        intake_record = None
-        for row in intake_data:
-            if row.get("Organization Name:") == org_name:
-                intake_record = row
-                break
+        intake_records = self._org_records("Intake", org_name)
+        intake_record = intake_records[0] if intake_records else None
 
         if not intake_record:
             return None
 
         # Get CEO data
-        ceo_data = self.sheet_data.get("CEO", [])
-        ceo_record = None
-        for row in ceo_data:
-            if row.get("CEO Organization") == org_name:
-                ceo_record = row
-                break
+        ceo_records = self._org_records("CEO", org_name)
+        ceo_record = ceo_records[0] if ceo_records else None
 
-        # Get Tech data
-        tech_data = self.sheet_data.get("Tech", [])
-        tech_records = [row for row in tech_data if row.get("Organization") == org_name]
-
-        # Get Staff data
-        staff_data = self.sheet_data.get("Staff", [])
-        staff_records = [row for row in staff_data if row.get("Organization") == org_name]
+        # Get Tech and Staff data
+        tech_records = self._org_records("Tech", org_name)
+        staff_records = self._org_records("Staff", org_name)
 
         # Calculate maturity assessment
         org_responses = {
@@ -133,14 +144,19 @@ class ReportGenerator:
                     org_name, free_text_responses
                 )
 
-                # Consolidate AI dimension summaries
+                # Consolidate AI dimension summaries (one LLM call for all)
                 if ai_insights and "dimensions" in ai_insights:
-                    for dimension, analysis in ai_insights["dimensions"].items():
-                        if "summary" in analysis and analysis["summary"]:
-                            # Target 120 characters for dimension summaries
-                            analysis["summary"] = self.ai_analyzer.consolidate_text(
-                                analysis["summary"], max_chars=120
-                            )
+                    dimensions = ai_insights["dimensions"]
+                    # Target 120 characters for dimension summaries
+                    summaries = self.ai_analyzer.consolidate_texts(
+                        {
+                            dimension: {"text": analysis["summary"], "max_chars": 120}
+                            for dimension, analysis in dimensions.items()
+                            if "summary" in analysis and analysis["summary"]
+                        }
+                    )
+                    for dimension, summary in summaries.items():
+                        dimensions[dimension]["summary"] = summary
             except Exception as e:
                 print(f"Warning: AI analysis failed for {org_name}: {e}")
 
@@ -202,7 +218,7 @@ class ReportGenerator:
             "timeline": self._build_aggregate_timeline(
                 intake_data, ceo_data, tech_data, staff_data
             ),
-            "table": self._build_aggregate_table(intake_data, ceo_data, tech_data, staff_data),
+            "table": self._build_aggregate_table(intake_data),
             "insights": self._build_aggregate_insights(ceo_data, tech_data, staff_data),
             "recommendations": self._build_aggregate_recommendations(
                 intake_data, ceo_data, tech_data, staff_data
@@ -627,13 +643,7 @@ class ReportGenerator:
         # Limit to recent 20 events
         return timeline[:20]
 
-    def _build_aggregate_table(
-        self,
-        intake_data: List[Dict],
-        ceo_data: List[Dict],
-        tech_data: List[Dict],
-        staff_data: List[Dict],
-    ) -> List[Dict[str, Any]]:
+    def _build_aggregate_table(self, intake_data: List[Dict]) -> List[Dict[str, Any]]:
         """Build aggregate organization status table."""
         org_status = []
 
@@ -643,9 +653,10 @@ class ReportGenerator:
                 continue
 
             # Find matching records
-            ceo_record = next((r for r in ceo_data if r.get("CEO Organization") == org_name), None)
-            tech_records = [r for r in tech_data if r.get("Organization") == org_name]
-            staff_records = [r for r in staff_data if r.get("Organization") == org_name]
+            ceo_records = self._org_records("CEO", org_name)
+            ceo_record = ceo_records[0] if ceo_records else None
+            tech_records = self._org_records("Tech", org_name)
+            staff_records = self._org_records("Staff", org_name)
 
             # Calculate status
             ceo_complete = bool(ceo_record and ceo_record.get("Date"))
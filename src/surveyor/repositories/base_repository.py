@@ -2,8 +2,9 @@
 Base repository pattern implementation.
 """
 
-from typing import TypeVar, Generic, List, Optional, Type, Any
+from typing import TypeVar, Generic, List, Optional, Type, Any, Dict
 from abc import ABC, abstractmethod
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 import logging
@@ -79,6 +80,34 @@ class BaseRepository(IRepository[T]):
             logger.error(f"Error creating {self.model_class.__name__}: {e}")
             raise
     
+    def bulk_create(self, entities: List[T]) -> List[T]:
+        """
+        Create many entities in one transaction.
+
+        Uses bulk_save_objects, which skips per-object unit-of-work
+        bookkeeping and refreshes; primary keys are not loaded back onto
+        the returned entities.
+        """
+        try:
+            self.session.bulk_save_objects(entities)
+            self.session.commit()
+            return entities
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Error bulk creating {self.model_class.__name__}: {e}")
+            raise
+    
+    def bulk_create_mappings(self, mappings: List[Dict[str, Any]]) -> int:
+        """Insert plain column dicts in one transaction without building ORM objects."""
+        try:
+            self.session.bulk_insert_mappings(self.model_class, mappings)
+            self.session.commit()
+            return len(mappings)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Error bulk inserting {self.model_class.__name__} mappings: {e}")
+            raise
+    
     def update(self, entity: T) -> T:
         """Update existing entity."""
         try:
@@ -90,20 +119,53 @@ class BaseRepository(IRepository[T]):
             logger.error(f"Error updating {self.model_class.__name__}: {e}")
             raise
     
+    def _has_delete_cascade(self) -> bool:
+        """Whether deleting this model must cascade to children through the ORM."""
+        return any(rel.cascade.delete for rel in inspect(self.model_class).relationships)
+    
     def delete(self, id: int) -> bool:
         """Delete entity by ID."""
         try:
-            entity = self.get_by_id(id)
-            if entity:
-                self.session.delete(entity)
-                self.session.commit()
-                return True
-            return False
+            if self._has_delete_cascade():
+                # Children are only removed by ORM cascades, so load and delete
+                entity = self.get_by_id(id)
+                deleted = 0
+                if entity:
+                    self.session.delete(entity)
+                    deleted = 1
+            else:
+                # Single DELETE statement, no SELECT or object materialization
+                deleted = self.session.query(self.model_class).filter(
+                    self.model_class.id == id
+                ).delete(synchronize_session=False)
+            self.session.commit()
+            return deleted > 0
         except SQLAlchemyError as e:
             self.session.rollback()
             logger.error(f"Error deleting {self.model_class.__name__} with ID {id}: {e}")
             raise
     
+    def bulk_delete(self, ids: List[int]) -> int:
+        """Delete entities by ID in one transaction; return the number deleted."""
+        if not ids:
+            return 0
+        try:
+            query = self.session.query(self.model_class).filter(self.model_class.id.in_(ids))
+            if self._has_delete_cascade():
+                # One SELECT for all entities, then ORM deletes so cascades run
+                entities = query.all()
+                for entity in entities:
+                    self.session.delete(entity)
+                deleted = len(entities)
+            else:
+                deleted = query.delete(synchronize_session=False)
+            self.session.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Error bulk deleting {self.model_class.__name__} with IDs {ids}: {e}")
+            raise
+    
     def find_by(self, **kwargs) -> List[T]:
         """Find entities by criteria."""
         try:
@@ -22,7 +22,8 @@ def main():
 
     # Initialize reader
     print("\n1. Loading data from Google Sheets...")
-    sheet_data = SheetsReader.fetch_all_tabs(verbose=True)
+    # Reuse tabs cached by earlier test runs for up to an hour
+    sheet_data = SheetsReader.fetch_all_tabs(verbose=True, max_age_seconds=3600)
 
     print(f"   ✓ Loaded {len(sheet_data)} tabs")
 
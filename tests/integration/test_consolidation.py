@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Test script for text consolidation feature.
-Tests the consolidate_text method with real examples.
+Tests the consolidate_texts method with real examples.
 """
 
 import os
@@ -12,39 +12,43 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from src.analytics.ai_analyzer import AIAnalyzer
 
+# Read once, after the imports above have loaded .env.local
+OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+
 # Test examples from the requirements
-EXAMPLES = {
-    "overall_description": {
-        "original": "Functional systems with integration gaps",
-        "target_length": 55,
-        "expected_range": (40, 60)
-    },
-    "program_technology": {
-        "original": "The organization exhibits a reactive, decentralized approach to technology adoption, characterized by ad-hoc purchasing and platform selection. There's a clear need for a more strategic, holistic technology governance framework that emphasizes centralized planning, integration, and comprehensive policy development.",
-        "target_length": 120,
-        "expected_range": (100, 150)
-    },
-    "business_systems": {
-        "original": "Staff responses reveal critical gaps in business system accessibility and functionality, particularly around financial management tools. There is a strong organizational need for more integrated, user-friendly systems that enable real-time decision-making and streamline complex operational workflows.",
-        "target_length": 120,
-        "expected_range": (100, 150)
-    },
-    "data_management": {
-        "original": "The organization is experiencing significant data management challenges, characterized by data quality degradation and unclear data utilization strategies. While multiple platforms are being used, there are fundamental gaps in data integrity, access, and analytical capabilities that need strategic intervention.",
-        "target_length": 120,
-        "expected_range": (100, 150)
-    },
-    "infrastructure": {
-        "original": "The organization is experiencing significant infrastructure maturity challenges, characterized by ad-hoc management, lack of standardized processes, and insufficient dedicated resources. However, there's an emerging awareness of the need for strategic infrastructure development to support organizational growth and operational efficiency.",
-        "target_length": 120,
-        "expected_range": (100, 150)
-    },
-    "organizational_culture": {
-        "original": "The organization demonstrates a mixed technological culture with pockets of innovation and enthusiasm, but suffers from inconsistent technology training, uneven adoption, and limited strategic investment in technological infrastructure. Leadership appears supportive of change, but systematic approaches to technology integration are lacking.",
-        "target_length": 120,
-        "expected_range": (100, 150)
-    }
-}
+# (name, original, target_length, min_len, max_len)
+EXAMPLES = (
+    (
+        "overall_description",
+        "Functional systems with integration gaps",
+        55, 40, 60,
+    ),
+    (
+        "program_technology",
+        "The organization exhibits a reactive, decentralized approach to technology adoption, characterized by ad-hoc purchasing and platform selection. There's a clear need for a more strategic, holistic technology governance framework that emphasizes centralized planning, integration, and comprehensive policy development.",
+        120, 100, 150,
+    ),
+    (
+        "business_systems",
+        "Staff responses reveal critical gaps in business system accessibility and functionality, particularly around financial management tools. There is a strong organizational need for more integrated, user-friendly systems that enable real-time decision-making and streamline complex operational workflows.",
+        120, 100, 150,
+    ),
+    (
+        "data_management",
+        "The organization is experiencing significant data management challenges, characterized by data quality degradation and unclear data utilization strategies. While multiple platforms are being used, there are fundamental gaps in data integrity, access, and analytical capabilities that need strategic intervention.",
+        120, 100, 150,
+    ),
+    (
+        "infrastructure",
+        "The organization is experiencing significant infrastructure maturity challenges, characterized by ad-hoc management, lack of standardized processes, and insufficient dedicated resources. However, there's an emerging awareness of the need for strategic infrastructure development to support organizational growth and operational efficiency.",
+        120, 100, 150,
+    ),
+    (
+        "organizational_culture",
+        "The organization demonstrates a mixed technological culture with pockets of innovation and enthusiasm, but suffers from inconsistent technology training, uneven adoption, and limited strategic investment in technological infrastructure. Leadership appears supportive of change, but systematic approaches to technology integration are lacking.",
+        120, 100, 150,
+    ),
+)
 
 
 def test_consolidation():
@@ -55,7 +59,7 @@ def test_consolidation():
     print()
 
     # Check for API key
-    if not os.getenv("OPENROUTER_API_KEY"):
+    if not OPENROUTER_API_KEY:
         print("❌ ERROR: OPENROUTER_API_KEY not found in environment")
         print("Please set the OPENROUTER_API_KEY in .env.local")
         return False
@@ -66,13 +70,17 @@ def test_consolidation():
         analyzer = AIAnalyzer()
         print("✓ AIAnalyzer initialized successfully\n")
 
-        all_passed = True
+        # Consolidate all examples with a single batched call
+        consolidated_texts = analyzer.consolidate_texts(
+            {
+                test_name: {"text": original, "max_chars": target}
+                for test_name, original, target, _, _ in EXAMPLES
+            }
+        )
 
-        for test_name, test_data in EXAMPLES.items():
-            original = test_data["original"]
-            target = test_data["target_length"]
-            min_len, max_len = test_data["expected_range"]
+        all_passed = True
 
+        for test_name, original, target, min_len, max_len in EXAMPLES:
             print("-" * 80)
             print(f"TEST: {test_name.replace('_', ' ').title()}")
             print("-" * 80)
@@ -80,8 +88,7 @@ def test_consolidation():
             print(f"  {original}")
             print()
 
-            # Consolidate
-            consolidated = analyzer.consolidate_text(original, max_chars=target)
+            consolidated = consolidated_texts[test_name]
 
             print(f"Consolidated ({len(consolidated)} chars):")
             print(f"  {consolidated}")
@@ -13,6 +13,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from src.services.report_generator import ReportGenerator
 from src.extractors.sheets_reader import SheetsReader
 
+# Read once, after the imports above have loaded .env.local
+OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+
 
 def test_report_consolidation():
     """Test that report generation includes consolidated text."""
@@ -22,7 +25,7 @@ def test_report_consolidation():
     print()
 
     # Check for API key
-    if not os.getenv("OPENROUTER_API_KEY"):
+    if not OPENROUTER_API_KEY:
         print("⚠️  WARNING: OPENROUTER_API_KEY not found in environment")
         print("AI consolidation will be skipped, but report will still generate.")
         print()
@@ -30,8 +33,8 @@ def test_report_consolidation():
     try:
         # Read Google Sheets data
         print("Loading Google Sheets data...")
-        reader = SheetsReader()
-        sheet_data = reader.fetch_all_tabs()
+        # Reuse tabs cached by earlier test runs for up to an hour
+        sheet_data = SheetsReader.fetch_all_tabs(max_age_seconds=3600)
         print(f"✓ Loaded {len(sheet_data)} sheets\n")
 
         # Get organization names
@@ -19,7 +19,8 @@ def main():
 
     # Load data
     print("Loading data...")
-    sheet_data = SheetsReader.fetch_all_tabs(verbose=False)
+    # Reuse tabs cached by earlier test runs for up to an hour
+    sheet_data = SheetsReader.fetch_all_tabs(verbose=False, max_age_seconds=3600)
     print(f"✓ Loaded {len(sheet_data)} tabs\n")
 
     # Generate report
@@ -5,6 +5,8 @@ Quick test script to verify templates are working correctly.
 
 import requests
 import sys
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 
 def test_endpoints():
     """Test all main endpoints to ensure they're working."""
@@ -21,22 +23,33 @@ def test_endpoints():
     print("=" * 50)
     
     all_passed = True
-    
-    for endpoint, name in endpoints:
+
+    # One keep-alive pool sized to cover every concurrent probe
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+    def probe(endpoint):
+        """GET one endpoint; returns (status_code, error)."""
         try:
-            url = f"{base_url}{endpoint}"
-            print(f"Testing {name:15} ({endpoint:20})", end=" ... ")
-            
-            response = requests.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                print("✅ PASS")
-            else:
-                print(f"❌ FAIL (Status: {response.status_code})")
-                all_passed = False
-                
+            response = session.get(f"{base_url}{endpoint}", timeout=5)
+            return response.status_code, None
         except requests.exceptions.RequestException as e:
-            print(f"❌ ERROR: {e}")
+            return None, e
+
+    # Endpoints are independent, so probe them all at once
+    with session, ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        results = list(executor.map(probe, [endpoint for endpoint, _ in endpoints]))
+
+    for (endpoint, name), (status_code, error) in zip(endpoints, results):
+        print(f"Testing {name:15} ({endpoint:20})", end=" ... ")
+
+        if error is not None:
+            print(f"❌ ERROR: {error}")
+            all_passed = False
+        elif status_code == 200:
+            print("✅ PASS")
+        else:
+            print(f"❌ FAIL (Status: {status_code})")
             all_passed = False
     
     print("\n" + "=" * 50)
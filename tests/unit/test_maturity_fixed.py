@@ -10,12 +10,16 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from src.analytics.maturity_rubric import MaturityRubric
 from src.extractors.sheets_reader import SheetsReader
 
+# Question-ID prefixes of the CEO, Tech Lead and Staff rating columns
+RATING_PREFIXES = ('C-', 'TL-', 'S-')
+
+
 def extract_numeric_responses(record):
     """Extract numeric responses from a survey record."""
     numeric_responses = {}
 
     for key, value in record.items():
-        if key.startswith(('C-', 'TL-', 'S-')) and value:
+        if value and key.startswith(RATING_PREFIXES):
             try:
                 num_value = float(str(value).strip())
                 # Only include if it's a valid rating (1-5, excluding 0 and 6)
@@ -48,9 +52,17 @@ def main():
     print(f"Testing Maturity Assessment for: {org_name}")
     print(f"{'='*60}\n")
 
+    # Index Tech and Staff records by organization (first record per org wins)
+    tech_by_org = {}
+    for record in tech_data:
+        tech_by_org.setdefault(record.get('Organization'), record)
+    staff_by_org = {}
+    for record in staff_data:
+        staff_by_org.setdefault(record.get('Organization'), record)
+
     # Find matching Tech and Staff records
-    tech_record = next((r for r in tech_data if r.get('Organization') == org_name), {})
-    staff_record = next((r for r in staff_data if r.get('Organization') == org_name), {})
+    tech_record = tech_by_org.get(org_name, {})
+    staff_record = staff_by_org.get(org_name, {})
 
     # Extract numeric responses
     ceo_responses = extract_numeric_responses(ceo_record)
@@ -0,0 +1,100 @@
+"""
+Regression tests for survey answer search after re-normalization.
+"""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+# Add project root and the flat db_utils module to the Python path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'scripts', 'utils'))
+
+from src.analytics.survey_analytics import SurveyAnalytics
+from src.normalizers.survey_normalizer import SurveyNormalizer
+
+
+def load_answers(db_path, answers):
+    """Insert one survey with one response per answer text."""
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(
+            "INSERT INTO surveys (id, survey_name, survey_type, spreadsheet_id) "
+            "VALUES (1, 'Tech Survey', 'survey', 'sheet-1')"
+        )
+        conn.execute(
+            "INSERT INTO survey_questions (id, survey_id, question_key, question_text) "
+            "VALUES (1, 1, 'q1', 'Which tools?')"
+        )
+        for i, text in enumerate(answers, 1):
+            conn.execute(
+                "INSERT INTO respondents (id, respondent_hash) VALUES (?, ?)", (i, f"hash-{i}")
+            )
+            conn.execute(
+                "INSERT INTO survey_responses (id, survey_id, respondent_id, response_date) "
+                "VALUES (?, 1, ?, '2025-01-01 00:00:00')",
+                (i, i),
+            )
+            conn.execute(
+                "INSERT INTO survey_answers (response_id, question_id, answer_text) VALUES (?, 1, ?)",
+                (i, text),
+            )
+    conn.close()
+
+
+@pytest.fixture
+def search_db(tmp_path, monkeypatch):
+    """A normalized SQLite database holding two answers, plus a live analytics instance."""
+    monkeypatch.delenv('DATABASE_URL', raising=False)
+    db_path = str(tmp_path / 'survey_normalized.db')
+
+    normalizer = SurveyNormalizer(target_db=db_path)
+    normalizer.create_normalized_schema()
+    load_answers(db_path, ['Salesforce CRM', 'Google Workspace'])
+
+    analytics = SurveyAnalytics(db_path, use_postgresql=False)
+    yield db_path, normalizer, analytics
+    analytics.close()
+    normalizer.close()
+
+
+def search_texts(analytics, term):
+    return sorted(row['answer_text'] for row in analytics.search_responses(term))
+
+
+def test_search_after_renormalization(search_db):
+    """Search sees rows loaded after the normalizer recreated its tables."""
+    db_path, normalizer, analytics = search_db
+    assert search_texts(analytics, 'sales') == ['Salesforce CRM']
+
+    normalizer.create_normalized_schema()
+    load_answers(db_path, ['Salesforce Nonprofit Cloud', 'Salesforce CRM'])
+
+    assert search_texts(analytics, 'sales') == ['Salesforce CRM', 'Salesforce Nonprofit Cloud']
+    assert search_texts(analytics, 'google') == []
+
+
+def test_search_after_answers_table_recreated(search_db):
+    """A recreated survey_answers table (triggers gone, index left behind) is reindexed."""
+    db_path, _, analytics = search_db
+    assert search_texts(analytics, 'work') == ['Google Workspace']
+
+    conn = sqlite3.connect(db_path)
+    with conn:
+        schema = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'survey_answers'"
+        ).fetchone()[0]
+        rows = conn.execute("SELECT response_id, question_id FROM survey_answers").fetchall()
+        conn.execute("DROP TABLE survey_answers")
+        conn.execute(schema)
+        conn.executemany(
+            "INSERT INTO survey_answers (response_id, question_id, answer_text) VALUES (?, ?, ?)",
+            [(response_id, question_id, 'Microsoft Teams') for response_id, question_id in rows],
+        )
+    conn.close()
+
+    assert search_texts(analytics, 'teams') == ['Microsoft Teams', 'Microsoft Teams']
+    assert search_texts(analytics, 'work') == []